@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from studio.curves import curve_from_points
+
 config.pixel_width = 1920
 config.pixel_height = 1080
 config.frame_rate = 60
@@ -186,22 +188,14 @@ class RepoIntro(Scene):
         # Frequency analysis graph (right bottom) - more subtle
         freq_x = np.linspace(0, 4*np.pi, 60)
         freq_y = np.sin(freq_x) * 0.2 + np.sin(2*freq_x) * 0.1
-        freq_graph = VMobject()
-        freq_graph.set_points_as_corners([
-            [x * 0.25 + 4.5, freq_y[i] - 2, 0]
-            for i, x in enumerate(freq_x)
-        ])
+        freq_graph = curve_from_points(np.column_stack([freq_x * 0.25 + 4.5, freq_y - 2, np.zeros_like(freq_x)]))
         freq_graph.set_stroke(color=BLUE, width=1)
         animations.add(freq_graph)
         
         # Static sine wave (right side) - no animation, just visual
         sine_x = np.linspace(0, 2*np.pi, 30)
         sine_y = np.sin(sine_x) * 0.3
-        sine_curve = VMobject()
-        sine_curve.set_points_as_corners([
-            [x * 0.25 + 5, sine_y[i] + 0.5, 0]
-            for i, x in enumerate(sine_x)
-        ])
+        sine_curve = curve_from_points(np.column_stack([sine_x * 0.25 + 5, sine_y + 0.5, np.zeros_like(sine_x)]))
         sine_curve.set_stroke(color="#00FFFF", width=1)
         animations.add(sine_curve)
         
@@ -1,8 +1,13 @@
 from manim import *
 import numpy as np
+import os
 import shutil
 import warnings
 
+from studio.curves import corner_bezier_points, curve_from_points
+from studio.freq_response import Responses, adaptive_omega, dc_gain, evaluate_systems, weighted_log_response
+from studio.quality import glow_layers
+
 config.pixel_width = 1920
 config.pixel_height = 1080
 config.frame_rate = 60
@@ -14,29 +19,155 @@ if not shutil.which("latex"):
     )
 
 
+class LivePoleZeroSystem(VGroup):
+    """Pole-zero map and polar curve driven by ValueTrackers.
+
+    Every pole/zero slot has a position tracker (x + iy) and a weight tracker;
+    a slot of weight 0 is absent from H(s) and invisible on the map, so systems
+    with different numbers of roots morph continuously. An updater recomputes
+    the response whenever a tracker moves and rewrites the curve's
+    preallocated Bezier points in place.
+    """
+    def __init__(self, omega, max_poles, max_zeros, s_plane_origin=ORIGIN, polar_origin=ORIGIN,
+                 scale=2.0, radius_scale=0.8, max_display=2.5, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.omega = omega
+        self.s_plane_origin = np.array(s_plane_origin, dtype=float)
+        self.polar_origin = np.array(polar_origin, dtype=float)
+        self.scale = scale
+        self.radius_scale = radius_scale
+        self.max_radius = max_display * 1.2
+
+        self.log_gain_tracker = ComplexValueTracker(0)
+        self.pole_slots = [self.make_slot(self.make_pole_marker()) for _ in range(max_poles)]
+        self.zero_slots = [self.make_slot(self.make_zero_marker()) for _ in range(max_zeros)]
+        self.markers = VGroup(*[slot["marker"] for slot in self.pole_slots + self.zero_slots])
+
+        self.anchors = np.zeros((len(omega), 3))
+        self.curve_points = np.empty((4 * (len(omega) - 1), 3))
+        self.curve = VMobject(stroke_width=4, color=color)
+        self.add(self.markers, self.curve)
+
+        self.last_state = None
+        self.update_response()
+        self.add_updater(lambda system: system.update_response())
+
+    @staticmethod
+    def make_slot(marker):
+        # Slots start parked (weight 0) at a harmless non-zero root
+        return {"position": ComplexValueTracker(-1), "weight": ValueTracker(0), "marker": marker}
+
+    @staticmethod
+    def make_pole_marker():
+        return VGroup(
+            Line(UP * 0.12 + LEFT * 0.12, DOWN * 0.12 + RIGHT * 0.12, stroke_width=3),
+            Line(UP * 0.12 + RIGHT * 0.12, DOWN * 0.12 + LEFT * 0.12, stroke_width=3),
+        ).set_color(RED_B)
+
+    @staticmethod
+    def make_zero_marker():
+        return Circle(radius=0.12, stroke_width=3, stroke_color=GREEN_B)
+
+    def set_system(self, K, poles=(), zeros=()):
+        """Jump straight to a system."""
+        self.log_gain_tracker.set_value(np.log(dc_gain(K, poles, zeros)))
+        for slots, roots in ((self.pole_slots, poles), (self.zero_slots, zeros)):
+            for slot, root in zip(slots, [*roots, *[None] * (len(slots) - len(roots))]):
+                slot["weight"].set_value(0 if root is None else 1)
+                if root is not None:
+                    slot["position"].set_value(complex(root))
+        return self.update_response()
+
+    def morph_to(self, K, poles=(), zeros=()):
+        """Animations gliding the current roots to a new system.
+
+        Roots are paired greedily by distance; unpaired old roots fade out
+        in place and unpaired new roots fade in at their position.
+        """
+        anims = [self.log_gain_tracker.animate.set_value(np.log(dc_gain(K, poles, zeros)))]
+        for slots, roots in ((self.pole_slots, poles), (self.zero_slots, zeros)):
+            roots = [complex(root) for root in roots]
+            active = [slot for slot in slots if slot["weight"].get_value() > 0]
+            free = [slot for slot in slots if slot["weight"].get_value() == 0]
+            pairs = sorted(
+                (abs(slot["position"].get_value() - root), i, j)
+                for i, slot in enumerate(active) for j, root in enumerate(roots)
+            )
+            paired_slots, paired_roots = set(), set()
+            for _, i, j in pairs:
+                if i in paired_slots or j in paired_roots:
+                    continue
+                paired_slots.add(i)
+                paired_roots.add(j)
+                anims.append(active[i]["position"].animate.set_value(roots[j]))
+            for i, slot in enumerate(active):
+                if i not in paired_slots:
+                    anims.append(slot["weight"].animate.set_value(0))
+            for j, root in enumerate(roots):
+                if j not in paired_roots:
+                    slot = free.pop(0)
+                    slot["position"].set_value(root)
+                    anims.append(slot["weight"].animate.set_value(1))
+        return anims
+
+    def color_to(self, color):
+        """Recolor the curve without suspending the response updater."""
+        start, end = self.curve.get_stroke_color(), ManimColor(color)
+        return UpdateFromAlphaFunc(
+            self.curve, lambda curve, alpha: curve.set_stroke(color=interpolate_color(start, end, alpha))
+        )
+
+    def update_response(self):
+        """Recompute markers and curve in place if any tracker moved."""
+        slots = self.pole_slots + self.zero_slots
+        state = (
+            self.log_gain_tracker.get_value(),
+            *[(slot["position"].get_value(), slot["weight"].get_value()) for slot in slots],
+        )
+        if state == self.last_state:
+            return self
+        self.last_state = state
+
+        for slot in slots:
+            root = slot["position"].get_value()
+            slot["marker"].move_to(self.s_plane_origin + self.scale * np.array([root.real, root.imag, 0]))
+            slot["marker"].set_stroke(opacity=slot["weight"].get_value())
+
+        log_h = weighted_log_response(
+            self.omega, self.log_gain_tracker.get_value(),
+            *self.active_roots(self.pole_slots), *self.active_roots(self.zero_slots),
+        )
+        radius = np.minimum(np.exp(log_h.real), self.max_radius) * self.radius_scale
+        self.anchors[:, 0] = radius * np.cos(log_h.imag)
+        self.anchors[:, 1] = radius * np.sin(log_h.imag)
+        self.anchors += self.polar_origin
+        corner_bezier_points(self.anchors, out=self.curve_points)
+        # Animations such as Create replace ``points``; re-attach the buffer.
+        self.curve.points = self.curve_points
+        return self
+
+    @staticmethod
+    def active_roots(slots):
+        active = [slot for slot in slots if slot["weight"].get_value() > 0]
+        return (
+            [slot["position"].get_value() for slot in active],
+            [slot["weight"].get_value() for slot in active],
+        )
+
+
 class PolarPolesZerosEducational(Scene):
+    # Set POLE_ZERO_MODE=continuous to glide poles and zeros between stages
+    # (LivePoleZeroSystem) instead of Transforming between fixed curves
+    continuous = os.environ.get("POLE_ZERO_MODE") == "continuous"
+
     def construct(self):
         self.camera.frame_width = 14
         self.camera.frame_height = 7.875
         self.camera.background_color = "#0a0a1e"
 
-        # Frequency array for evaluation
+        # Fixed frequency grid for the continuous (tracker-driven) mode
         omega = np.logspace(-2.5, 1.5, 800)
 
-        def evaluate_response(K, poles=None, zeros=None):
-            """Calculate magnitude and phase from poles and zeros"""
-            poles = poles or []
-            zeros = zeros or []
-            s = 1j * omega
-            H = np.ones_like(s, dtype=complex) * K
-            for z in zeros:
-                H *= (s - z)
-            for p in poles:
-                H /= (s - p)
-            magnitude = np.abs(H)
-            phase = np.unwrap(np.angle(H))
-            return magnitude, phase
-
         def build_s_plane(scale=2.0):
             """Build s-plane coordinate system (left side)"""
             group = VGroup()
@@ -95,22 +226,11 @@ class PolarPolesZerosEducational(Scene):
 
         def plot_polar_curve(magnitude, phase, color, max_display=2.5):
             """Create polar curve from magnitude and phase"""
-            # Clip magnitude for display
-            mag_clipped = np.clip(magnitude, 0, max_display * 1.2)
-            
-            def polar_func(t):
-                idx = min(int(t * (len(omega) - 1)), len(omega) - 1)
-                r = mag_clipped[idx] * 0.8  # Scale to fit display
-                theta = phase[idx]
-                return np.array([r * np.cos(theta), r * np.sin(theta), 0])
-            
-            curve = ParametricFunction(
-                polar_func,
-                t_range=[0, 1],
-                stroke_width=4,
-                color=color,
-            )
-            return curve
+            # Clip magnitude for display, scaled to fit
+            radius = np.clip(magnitude, 0, max_display * 1.2) * 0.8
+            points = np.column_stack([radius * np.cos(phase), radius * np.sin(phase), np.zeros_like(radius)])
+            # Smooth spline through the (adaptively spaced) samples
+            return curve_from_points(points, smooth=True, stroke_width=4, color=color)
 
         def draw_poles_zeros(poles, zeros, scale=2.0):
             """Draw pole-zero markers on s-plane"""
@@ -164,7 +284,8 @@ class PolarPolesZerosEducational(Scene):
             glow3 = Circle(radius=radius * 1.2, stroke_color=color, stroke_width=1, fill_color=color, fill_opacity=0.4)
             # Core dot
             core = Dot(color=color, radius=radius)
-            dot_group.add(glow1, glow2, glow3, core)
+            # Draft renders keep only the innermost glow
+            dot_group.add(*[glow1, glow2, glow3][-glow_layers(3):], core)
             return dot_group
 
         # Title + central phase banner
@@ -308,6 +429,14 @@ class PolarPolesZerosEducational(Scene):
             },
         ]
 
+        # Each stage gets its own 200-point grid, dense where its polar curve
+        # bends or moves fastest; all stages are evaluated in one batched pass
+        systems = [(st["K"], st["poles"], st["zeros"]) for st in stages]
+        responses = Responses(evaluate_systems(adaptive_omega(systems, budget=200, max_radius=2.5 * 1.2), systems))
+
+        max_poles = max(len(st["poles"]) for st in stages)
+        max_zeros = max(len(st["zeros"]) for st in stages)
+
         pz_markers = None
         polar_curve = None
         polar_cursor = None
@@ -328,14 +457,15 @@ class PolarPolesZerosEducational(Scene):
                 self.play(ReplacementTransform(tf_display, new_tf), run_time=0.5)
                 tf_display = new_tf
             
-            # Draw poles and zeros on s-plane
-            new_pz_markers = draw_poles_zeros(stage["poles"], stage["zeros"]).shift(LEFT * panel_offset)
-            
-            if pz_markers is None:
-                pz_markers = new_pz_markers
-                self.play(Create(pz_markers), run_time=0.6)
-            else:
-                self.play(Transform(pz_markers, new_pz_markers), run_time=0.6)
+            # Draw poles and zeros on s-plane (the live system moves its own markers)
+            if not self.continuous:
+                new_pz_markers = draw_poles_zeros(stage["poles"], stage["zeros"]).shift(LEFT * panel_offset)
+
+                if pz_markers is None:
+                    pz_markers = new_pz_markers
+                    self.play(Create(pz_markers), run_time=0.6)
+                else:
+                    self.play(Transform(pz_markers, new_pz_markers), run_time=0.6)
             
             # Calculate and display asymptotic angles
             start_angle, end_angle = calc_asymptotic_angles(stage["poles"], stage["zeros"])
@@ -344,12 +474,22 @@ class PolarPolesZerosEducational(Scene):
             angle_annotation = angle_text
             
             # Calculate polar response
-            mag, phase = evaluate_response(stage["K"], stage["poles"], stage["zeros"])
-            new_polar_curve = plot_polar_curve(mag, phase, stage["color"]).shift(RIGHT * panel_offset)
+            mag, phase = responses.magnitude[idx], responses.phase[idx]
             
             if polar_curve is None:
-                polar_curve = new_polar_curve
+                if self.continuous:
+                    live_system = LivePoleZeroSystem(
+                        omega, max_poles, max_zeros,
+                        s_plane_origin=LEFT * panel_offset, polar_origin=RIGHT * panel_offset,
+                        color=stage["color"],
+                    )
+                    live_system.set_system(stage["K"], stage["poles"], stage["zeros"])
+                    polar_curve = live_system.curve
+                else:
+                    polar_curve = plot_polar_curve(mag, phase, stage["color"]).shift(RIGHT * panel_offset)
                 self.play(Create(polar_curve), run_time=1.6, rate_func=smooth)
+                if self.continuous:
+                    self.add(live_system)
                 polar_cursor = create_glow_dot(stage["color"], radius=0.12)
                 polar_cursor.move_to(polar_curve.point_from_proportion(0))
                 trail = TracedPath(
@@ -360,11 +500,20 @@ class PolarPolesZerosEducational(Scene):
                 )
                 self.add(trail, polar_cursor)
             else:
-                self.play(
-                    Transform(polar_curve, new_polar_curve),
-                    run_time=1.2,
-                    rate_func=smooth
-                )
+                if self.continuous:
+                    self.play(
+                        *live_system.morph_to(stage["K"], stage["poles"], stage["zeros"]),
+                        live_system.color_to(stage["color"]),
+                        run_time=1.2,
+                        rate_func=smooth
+                    )
+                else:
+                    new_polar_curve = plot_polar_curve(mag, phase, stage["color"]).shift(RIGHT * panel_offset)
+                    self.play(
+                        Transform(polar_curve, new_polar_curve),
+                        run_time=1.2,
+                        rate_func=smooth
+                    )
                 polar_cursor.move_to(polar_curve.point_from_proportion(0))
                 # Update color of all glow layers
                 for mob in polar_cursor:
@@ -1,5 +1,11 @@
 from manim import *
 import numpy as np
+import os
+
+from studio.pool import MobjectPool
+from studio.rng import stream
+from studio.text_cache import cached_text
+from studio.training_log import downsample_log, read_training_log
 
 # TikTok 9:16
 config.pixel_width = 1080
@@ -11,67 +17,176 @@ config.background_color = "#06060a"
 
 
 class TracedLossCurve(VGroup):
-    def __init__(self, width=7.5, height=1.8, **kwargs):
+    """Append-only loss curve with constant per-step cost.
+
+    Projected points and Bezier control points live in preallocated arrays
+    (doubled when full). Each ``trace`` only projects the new point, finalizes
+    the previous segment's end handle and grows one new tail segment, so long
+    training logs stay cheap. Position the curve before the first ``trace``.
+    """
+    def __init__(self, width=7.5, height=1.8, max_step=30, max_loss=5, capacity=64, **kwargs):
         super().__init__(**kwargs)
-        self.data = []
+        self.max_loss = max_loss
         self.axes = Axes(
-            x_range=[0, 30, 5], y_range=[0, 5, 1],
+            x_range=[0, max_step, max_step / 6], y_range=[0, max_loss, max_loss / 5],
             x_length=width, y_length=height,
             axis_config={"color": GRAY_C, "stroke_width": 1, "include_ticks": False},
             tips=False,
         )
         x_lab = Text("step", font_size=18, color=GRAY_D).next_to(self.axes, DOWN, buff=0.05)
         y_lab = Text("loss", font_size=18, color=GRAY_D).next_to(self.axes, LEFT, buff=0.05)
+        self.anchors = np.zeros((capacity, 3))
+        self.curve_points = np.zeros((4 * capacity, 3))
+        self.count = 0
+        # Finished segments live in ``line``; the newest one grows in ``tail``
         self.line = VMobject(color=TEAL_A, stroke_width=3)
+        self.tail = VMobject(color=TEAL_A, stroke_width=3)
         self.dot = Dot(radius=0.1, color=YELLOW)
-        self.add(self.axes, x_lab, y_lab, self.line, self.dot)
-
-    def trace(self, step, loss, scene):
-        self.data.append((step, np.clip(loss, 0.2, 5)))
-        pts = [self.axes.c2p(s, l) for s, l in self.data]
-        new_line = VMobject(color=TEAL_A, stroke_width=3)
-        if len(pts) >= 2:
-            new_line.set_points_smoothly(pts)
+        self.add(self.axes, x_lab, y_lab, self.line, self.tail, self.dot)
+
+    def append(self, step, loss):
+        """Add a point and return the Bezier control points of the new tail."""
+        if self.count == len(self.anchors):
+            self.anchors = np.concatenate([self.anchors, np.zeros_like(self.anchors)])
+            self.curve_points = np.concatenate([self.curve_points, np.zeros_like(self.curve_points)])
+        n = self.count
+        self.anchors[n] = self.axes.c2p(step, np.clip(loss, 0.2, self.max_loss))
+        self.count += 1
+        if n == 0:
+            return None
+
+        # Catmull-Rom tangent at the previous point now that its neighbour is known
+        p = self.anchors
+        if n >= 2:
+            tangent = (p[n] - p[n - 2]) / 2
+            self.curve_points[4 * (n - 2) + 2] = p[n - 1] - tangent / 3
+        else:
+            tangent = p[n] - p[n - 1]
+        segment = self.curve_points[4 * (n - 1):4 * n]
+        segment[0] = p[n - 1]
+        segment[1] = p[n - 1] + tangent / 3
+        segment[2] = p[n] - (p[n] - p[n - 1]) / 3
+        segment[3] = p[n]
+        self.line.points = self.curve_points[:4 * (n - 1)]
+        return segment
+
+    def trace(self, step, loss, scene, run_time=0.08):
+        segment = self.append(step, loss)
+        if segment is None:
+            scene.play(self.dot.animate.move_to(self.anchors[0]), run_time=run_time)
+            return
+
+        def grow_tail(tail, alpha):
+            tail.points = partial_bezier_points(segment, 0, alpha)
+
+        def follow_tail(dot, alpha):
+            dot.move_to(bezier(segment)(alpha))
+
         scene.play(
-            Transform(self.line, new_line),
-            self.dot.animate.move_to(pts[-1]),
-            run_time=0.08,
+            UpdateFromAlphaFunc(self.tail, grow_tail),
+            UpdateFromAlphaFunc(self.dot, follow_tail),
+            run_time=run_time,
         )
 
 
-class TransformerNetwork(VGroup):
-    def __init__(self, **kwargs):
+def blended_rgbas(colors, count, opacity=1.0):
+    """(count, 4) RGBA rows running through ``colors`` like ``color_gradient``.
+
+    Point clouds are written straight into the frame without alpha blending,
+    so ``opacity`` is baked in by mixing towards the background colour.
+    """
+    stops = np.array([color_to_rgba(color) for color in colors])
+    t = np.linspace(0, len(colors) - 1, count)
+    rgbas = np.stack([np.interp(t, np.arange(len(colors)), stops[:, k]) for k in range(4)], axis=1)
+    background = color_to_rgba(config.background_color)
+    rgbas[:, :3] = background[:3] + opacity * (rgbas[:, :3] - background[:3])
+    rgbas[:, 3] = 1
+    return rgbas
+
+
+class NeuronCloud(PMobject):
+    """Every neuron of one block as a single point cloud.
+
+    Positions live in ``points`` and colours in ``rgbas``, so jitter and
+    colour gradients are whole-array updates and one animation moves the
+    whole block regardless of how many neurons it has.
+    """
+    def __init__(self, positions, color, radius=0.04, opacity=0.85, **kwargs):
+        # Point thickness is in pixels; match the diameter of a Dot of ``radius``
+        diameter = 2 * radius * config.pixel_width / config.frame_width
+        super().__init__(stroke_width=diameter, **kwargs)
+        self.add_points(positions, rgbas=blended_rgbas([color], len(positions), opacity))
+
+    def fade(self, darkness=0.5, family=True):
+        # No alpha channel to lower: fade towards the background instead
+        return self.fade_to(config.background_color, darkness)
+
+    def shift_to(self, points, rgbas, **kwargs):
+        """One animation moving every neuron to ``points`` and recolouring to ``rgbas``."""
+        start_points, start_rgbas = self.points.copy(), self.rgbas.copy()
+
+        def update(cloud, alpha):
+            cloud.points = start_points + alpha * (points - start_points)
+            cloud.rgbas = start_rgbas + alpha * (rgbas - start_rgbas)
+
+        return UpdateFromAlphaFunc(self, update, **kwargs)
+
+
+def glide(mobject, target, scale=1, opacity=None):
+    """``mobject.animate.move_to(target).scale(scale)`` without copying ``mobject``.
+
+    ``opacity`` fades the stroke to that value on the way, like ``set_opacity``.
+    """
+    start_points = mobject.points.copy()
+    center = mobject.get_center()
+    start_opacity = mobject.get_stroke_opacity()
+
+    def update(m, alpha):
+        m.points[...] = center + (start_points - center) * (1 + alpha * (scale - 1)) + alpha * (target - center)
+        if opacity is not None:
+            m.set_stroke(opacity=start_opacity + alpha * (opacity - start_opacity))
+
+    return UpdateFromAlphaFunc(mobject, update)
+
+
+class TransformerNetwork(Group):
+    # (name, x, y, colour, neurons); scale the counts up freely, each block
+    # stays one point cloud
+    BLOCK_SPECS = [
+        ("Embed", 0, 2.4, BLUE_B, 40),
+        ("Attention", 0, 1.2, RED_C, 55),
+        ("MoE", 0, 0, ORANGE, 70),
+        ("FFN", 0, -1.2, PURPLE_B, 55),
+        ("Output", 0, -2.4, GREEN_C, 40),
+    ]
+
+    def __init__(self, block_specs=None, **kwargs):
         super().__init__(**kwargs)
         self.blocks = {}
-        self.all_dots = []
+        # Flow particles and backprop jitter draw from one seeded stream
+        self.rng = stream("TransformerNetwork")
+        # Flow particles and the backprop wave are recycled, not rebuilt per beat
+        self.particles = MobjectPool(lambda: Dot(radius=0.05, color=YELLOW), prefill=8)
+        self.waves = MobjectPool(
+            lambda: Line(LEFT * 3.3, RIGHT * 3.3, stroke_width=4, color=RED_C, stroke_opacity=0.9),
+            prefill=1,
+        )
 
         # Spread vertically across more space
-        block_specs = [
-            ("Embed", 0, 2.4, BLUE_B, 40),
-            ("Attention", 0, 1.2, RED_C, 55),
-            ("MoE", 0, 0, ORANGE, 70),
-            ("FFN", 0, -1.2, PURPLE_B, 55),
-            ("Output", 0, -2.4, GREEN_C, 40),
-        ]
-
-        for name, cx, cy, col, count in block_specs:
+        for name, cx, cy, col, count in block_specs or self.BLOCK_SPECS:
             block = self.make_block(name, cx, cy, col, count)
             self.blocks[name.lower()] = block
             self.add(block["boundary"], block["dots"], block["label"])
-            self.all_dots.extend(block["dots"])
 
         self.connections = self.make_connections()
         self.add(self.connections)
 
     def make_block(self, name, cx, cy, col, count):
-        dots = VGroup()
-        rng = np.random.default_rng(hash(name) % 1000)
+        rng = stream("TransformerNetwork", name)
         w, h = 6.0, 0.85
-        for i in range(count):
-            x = cx + rng.uniform(-w/2, w/2)
-            y = cy + rng.uniform(-h/2, h/2)
-            dot = Dot(point=[x, y, 0], radius=0.04, color=col, fill_opacity=0.85)
-            dots.add(dot)
+        positions = np.zeros((count, 3))
+        positions[:, :2] = [cx - w/2, cy - h/2] + rng.random((count, 2)) * [w, h]
+        dots = NeuronCloud(positions, col)
 
         label = Text(name, font_size=22, color=col, weight=BOLD)
         label.move_to([cx - 3.5, cy, 0])
@@ -83,11 +198,15 @@ class TransformerNetwork(VGroup):
         )
         boundary.move_to([cx, cy, 0])
 
-        return {"dots": dots, "label": label, "boundary": boundary, "center": np.array([cx, cy, 0]), "color": col}
+        return {
+            "dots": dots, "label": label, "boundary": boundary,
+            "center": np.array([cx, cy, 0]), "color": col,
+            "gradient": blended_rgbas([col, WHITE, col], count, opacity=0.85),
+        }
 
     def make_connections(self):
         lines = VGroup()
-        blocks = ["embed", "attention", "moe", "ffn", "output"]
+        blocks = list(self.blocks)
         for i in range(len(blocks) - 1):
             start = self.blocks[blocks[i]]["center"] + DOWN * 0.5
             end = self.blocks[blocks[i + 1]]["center"] + UP * 0.5
@@ -96,49 +215,48 @@ class TransformerNetwork(VGroup):
         return lines
 
     def flow_forward(self, scene):
-        blocks = ["embed", "attention", "moe", "ffn", "output"]
+        blocks = list(self.blocks)
         for i in range(len(blocks) - 1):
             start = self.blocks[blocks[i]]["center"]
             end = self.blocks[blocks[i + 1]]["center"]
-            particles = VGroup(*[
-                Dot(radius=0.05, color=YELLOW).move_to(start + np.array([np.random.uniform(-0.5, 0.5), 0, 0]))
-                for _ in range(8)
-            ])
-            scene.add(particles)
+            offsets = self.rng.uniform(-0.5, 0.5, (2, 8))
+            particles = self.particles.acquire(len(offsets[0]))
+            for p, dx in zip(particles, offsets[0]):
+                p.move_to(start + np.array([dx, 0, 0]))
+            scene.add(*particles)
             scene.play(
-                LaggedStart(*[p.animate.move_to(end + np.array([np.random.uniform(-0.5, 0.5), 0, 0])).scale(0.7)
-                              for p in particles], lag_ratio=0.03, run_time=0.12)
+                LaggedStart(*[glide(p, end + np.array([dx, 0, 0]), scale=0.7)
+                              for p, dx in zip(particles, offsets[1])], lag_ratio=0.03, run_time=0.12)
             )
-            scene.remove(particles)
+            scene.remove(*particles)
+            self.particles.release(*particles)
 
     def backprop_update(self, scene, intensity=0.06):
-        wave = Line(
-            self.blocks["output"]["center"] + LEFT * 3.3,
-            self.blocks["output"]["center"] + RIGHT * 3.3,
-            stroke_width=4, color=RED_C, stroke_opacity=0.9
-        )
+        first, *_, last = self.blocks.values()
+        wave = self.waves.acquire().move_to(last["center"])
         scene.add(wave)
         scene.play(
-            wave.animate.move_to(self.blocks["embed"]["center"]).set_opacity(0),
+            glide(wave, first["center"], opacity=0),
             run_time=0.3, rate_func=linear
         )
         scene.remove(wave)
+        self.waves.release(wave)
 
-        rng = np.random.default_rng()
         anims = []
-        for block_name, block in self.blocks.items():
-            cols = color_gradient([block["color"], WHITE, block["color"]], len(block["dots"]))
-            for i, dot in enumerate(block["dots"]):
-                target = dot.get_center() + np.array([
-                    rng.uniform(-intensity, intensity),
-                    rng.uniform(-intensity * 0.4, intensity * 0.4), 0
-                ])
-                anims.append(dot.animate.move_to(target).set_color(cols[i]))
-        
-        scene.play(LaggedStart(*anims, lag_ratio=0.001, run_time=0.35, rate_func=smooth))
+        for block in self.blocks.values():
+            cloud = block["dots"]
+            jitter = np.zeros_like(cloud.points)
+            jitter[:, :2] = (self.rng.random((len(jitter), 2)) * 2 - 1) * [intensity, intensity * 0.4]
+            anims.append(cloud.shift_to(cloud.points + jitter, block["gradient"]))
+
+        scene.play(*anims, run_time=0.35, rate_func=smooth)
 
 
 class TikTokGradientDescent(Scene):
+    # Optional CSV/JSONL training log (or TRAINING_LOG env var); it is streamed
+    # and downsampled to the number of loss-curve updates the scene makes
+    training_log = os.environ.get("TRAINING_LOG")
+
     def construct(self):
         self.camera.background_color = config.background_color
 
@@ -174,11 +292,20 @@ class TikTokGradientDescent(Scene):
              ["<<money>>", "Markets... welfare...", "Mixed economies balance needs."]),
         ]
 
+        # Three loss updates per prompt: forward pass + two backprop steps
+        if self.training_log:
+            self.loss_data = downsample_log(read_training_log(self.training_log), 3 * len(prompts))
+            if not self.loss_data:
+                raise ValueError(f"training log {self.training_log} has no rows with a finite loss")
+
         # BUILD UI - spread across full 16 units height
         title = Text("Transformer Training", font_size=42, weight=BOLD, color=WHITE)
         title.to_edge(UP, buff=0.3)
 
-        loss_curve = TracedLossCurve()
+        loss_curve = TracedLossCurve(
+            max_step=max(30, self.loss_data[-1][0]),
+            max_loss=max(5, np.ceil(max(loss for _, loss in self.loss_data))),
+        )
         loss_curve.next_to(title, DOWN, buff=0.25)
 
         step_txt = Text("Step 0", font_size=28, color=GRAY_B)
@@ -228,7 +355,7 @@ class TikTokGradientDescent(Scene):
         for idx, (prompt, expected, stages) in enumerate(prompts):
             step = idx + 1
 
-            new_step = Text(f"Step {step}", font_size=28, color=GRAY_B)
+            new_step = cached_text(f"Step {step}", font_size=28, color=GRAY_B)
             new_step.move_to(step_txt)
             self.play(Transform(step_txt, new_step), run_time=0.06)
 
@@ -236,17 +363,17 @@ class TikTokGradientDescent(Scene):
                 self.play(FadeOut(input_text), FadeOut(expected_text), FadeOut(output_text), run_time=0.05)
 
             # Show input
-            input_text = Text(prompt, font_size=26, color=WHITE)
+            input_text = cached_text(prompt, font_size=26, color=WHITE)
             input_text.move_to(input_box.get_center())
             self.play(FadeIn(input_text), run_time=0.1)
 
             # Show expected
-            expected_text = Text(expected, font_size=22, color=GREEN_A)
+            expected_text = cached_text(expected, font_size=22, color=GREEN_A)
             expected_text.move_to(expected_box.get_center())
             self.play(FadeIn(expected_text), run_time=0.1)
 
             # STAGE 1: Gibberish
-            output_text = Text(stages[0], font_size=22, color=RED_C)
+            output_text = cached_text(stages[0], font_size=22, color=RED_C)
             output_text.move_to(output_box.get_center())
             self.play(
                 FadeIn(output_text),
@@ -261,7 +388,7 @@ class TikTokGradientDescent(Scene):
             self.trace_loss(loss_curve)
 
             # STAGE 2: Partial
-            new_output = Text(stages[1], font_size=22, color=YELLOW_C)
+            new_output = cached_text(stages[1], font_size=22, color=YELLOW_C)
             new_output.move_to(output_box.get_center())
             self.play(
                 Transform(output_text, new_output),
@@ -273,7 +400,7 @@ class TikTokGradientDescent(Scene):
             self.trace_loss(loss_curve)
 
             # STAGE 3: Aligned
-            final_output = Text(stages[2], font_size=22, color=GREEN_C)
+            final_output = cached_text(stages[2], font_size=22, color=GREEN_C)
             final_output.move_to(output_box.get_center())
             self.play(
                 Transform(output_text, final_output),
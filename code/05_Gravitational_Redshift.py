@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from studio.curves import corner_bezier_points
+from studio.quality import glow_layers
+from studio.sprites import freeze
+
 # TikTok 9:16 - use top 3/4 for content
 config.pixel_width = 1080
 config.pixel_height = 1920
@@ -20,9 +24,9 @@ class BlackHole(VGroup):
         # Event horizon
         horizon = Circle(radius=radius, color=BLACK, fill_opacity=1.0, stroke_width=0)
         
-        # Accretion disk glow
-        glow_layers = VGroup()
-        for i in range(5):
+        # Accretion disk glow (draft renders keep only the inner layers)
+        glow = VGroup()
+        for i in range(glow_layers(5)):
             layer_radius = radius * (1.5 + i * 0.3)
             layer = Circle(
                 radius=layer_radius,
@@ -30,7 +34,7 @@ class BlackHole(VGroup):
                 fill_color=interpolate_color(ORANGE, BLACK, i / 5),
                 fill_opacity=0.3 - i * 0.05,
             )
-            glow_layers.add(layer)
+            glow.add(layer)
         
         # Inner bright ring (accretion disk)
         ring = Circle(
@@ -40,9 +44,11 @@ class BlackHole(VGroup):
             fill_opacity=0,
         )
         
-        self.add(glow_layers, ring, horizon)
+        self.add(glow, ring, horizon)
         self.horizon = horizon
         self.ring = ring
+        # Static glow stack: blit from one cached raster
+        freeze(self)
 
 
 class Astronaut(VGroup):
@@ -90,57 +96,107 @@ class Torch(VGroup):
         self.beam = beam
 
 
+def warp_grid_points(points, black_hole_pos, curvature, out=None):
+    """Pull grid points toward the black hole with a 1/r^1.5 falloff.
+
+    ``points`` is any (..., 3) array; the whole grid is warped in one
+    batched NumPy pass. Points within 0.1 of the hole are left in place.
+    """
+    if out is None:
+        out = np.empty_like(points)
+    offset = np.asarray(black_hole_pos, dtype=float)[:2] - points[..., :2]
+    dist = np.sqrt(np.sum(offset * offset, axis=-1, keepdims=True))
+    # direction * strength = (offset / dist) * (curvature / dist^1.5)
+    strength = np.where(dist > 0.1, curvature / np.maximum(dist, 0.1) ** 2.5, 0.0)
+    out[...] = points
+    out[..., :2] += offset * strength
+    return out
+
+
 class SpacetimeGrid(VGroup):
     """Curved spacetime grid."""
-    def __init__(self, black_hole_pos=ORIGIN, curvature=1.0, **kwargs):
+    def __init__(self, black_hole_pos=ORIGIN, curvature=1.0, num_lines=12, samples=50, **kwargs):
         super().__init__(**kwargs)
-        self.black_hole_pos = black_hole_pos
+        self.black_hole_pos = np.array(black_hole_pos, dtype=float)
         self.curvature = curvature
         
-        # Create grid lines
-        grid_lines = VGroup()
-        
-        # Horizontal lines
-        for y in np.linspace(-3, 5, 12):
-            points = []
-            for x in np.linspace(-4, 4, 50):
-                pos = np.array([x, y, 0])
-                # Apply curvature based on distance to black hole
-                dist = np.linalg.norm(pos[:2] - black_hole_pos[:2])
-                if dist > 0.1:
-                    # Warp towards black hole
-                    direction = (black_hole_pos[:2] - pos[:2]) / dist
-                    warp_strength = curvature * (1 / (dist ** 1.5))
-                    warped_pos = pos + np.append(direction * warp_strength, 0)
-                    points.append(warped_pos)
-                else:
-                    points.append(pos)
-            
-            if len(points) > 1:
-                line = VMobject(stroke_color=BLUE_D, stroke_width=1, stroke_opacity=0.3)
-                line.set_points_as_corners(points)
-                grid_lines.add(line)
-        
-        # Vertical lines
-        for x in np.linspace(-4, 4, 12):
-            points = []
-            for y in np.linspace(-3, 5, 50):
-                pos = np.array([x, y, 0])
-                dist = np.linalg.norm(pos[:2] - black_hole_pos[:2])
-                if dist > 0.1:
-                    direction = (black_hole_pos[:2] - pos[:2]) / dist
-                    warp_strength = curvature * (1 / (dist ** 1.5))
-                    warped_pos = pos + np.append(direction * warp_strength, 0)
-                    points.append(warped_pos)
-                else:
-                    points.append(pos)
-            
-            if len(points) > 1:
-                line = VMobject(stroke_color=BLUE_D, stroke_width=1, stroke_opacity=0.3)
-                line.set_points_as_corners(points)
-                grid_lines.add(line)
-        
+        # Flat grid as one (2 * num_lines, samples, 3) array:
+        # rows [0, num_lines) are horizontal lines, the rest vertical lines
+        xs = np.linspace(-4, 4, samples)
+        ys = np.linspace(-3, 5, samples)
+        horizontal_x, horizontal_y = np.meshgrid(xs, np.linspace(-3, 5, num_lines))
+        vertical_y, vertical_x = np.meshgrid(ys, np.linspace(-4, 4, num_lines))
+        self.flat_points = np.zeros((2 * num_lines, samples, 3))
+        self.flat_points[:num_lines, :, 0] = horizontal_x
+        self.flat_points[:num_lines, :, 1] = horizontal_y
+        self.flat_points[num_lines:, :, 0] = vertical_x
+        self.flat_points[num_lines:, :, 1] = vertical_y
+        
+        grid_lines = VGroup(*[
+            VMobject(stroke_color=BLUE_D, stroke_width=1, stroke_opacity=0.3)
+            for _ in range(2 * num_lines)
+        ])
+        self.grid_lines = grid_lines
         self.add(grid_lines)
+        self.warp()
+
+    def warp(self, black_hole_pos=None, curvature=None):
+        """Recompute every line from the flat grid, e.g. for a moving black hole."""
+        if black_hole_pos is not None:
+            self.black_hole_pos = np.array(black_hole_pos, dtype=float)
+        if curvature is not None:
+            self.curvature = curvature
+        warped = warp_grid_points(self.flat_points, self.black_hole_pos, self.curvature)
+        for line, points in zip(self.grid_lines, corner_bezier_points(warped)):
+            line.points = points
+        return self
+
+
+class LiveSpacetimeGrid(SpacetimeGrid):
+    """Spacetime grid whose curvature and black-hole position are ValueTrackers.
+
+    An updater re-warps the existing lines every frame: the warped points and
+    Bezier control points live in preallocated arrays, and every line keeps a
+    fixed view into them, so no mobjects or point arrays are created per frame.
+    Animate ``curvature_tracker`` or ``position_tracker`` (x + iy) to deepen or
+    move the well.
+    """
+    def __init__(self, black_hole_pos=ORIGIN, curvature=1.0, **kwargs):
+        self.curvature_tracker = ValueTracker(curvature)
+        self.position_tracker = ComplexValueTracker(complex(black_hole_pos[0], black_hole_pos[1]))
+        super().__init__(black_hole_pos=black_hole_pos, curvature=curvature, **kwargs)
+        self.add_updater(lambda grid: grid.update_warp())
+
+    def warp(self, black_hole_pos=None, curvature=None):
+        if black_hole_pos is not None:
+            self.position_tracker.set_value(complex(black_hole_pos[0], black_hole_pos[1]))
+        if curvature is not None:
+            self.curvature_tracker.set_value(curvature)
+        if not hasattr(self, "curve_points"):
+            # First call comes from SpacetimeGrid.__init__: allocate the buffers
+            self.warped_points = np.empty_like(self.flat_points)
+            lines, samples = self.flat_points.shape[:2]
+            self.curve_points = np.empty((lines, 4 * (samples - 1), 3))
+            self.line_views = list(self.curve_points)
+        self.last_state = None
+        return self.update_warp()
+
+    def update_warp(self):
+        """Recompute the warp in place if either tracker moved."""
+        position = self.position_tracker.get_value()
+        curvature = self.curvature_tracker.get_value()
+        state = (position, curvature)
+        if state == self.last_state:
+            return self
+        self.last_state = state
+        self.black_hole_pos = np.array([position.real, position.imag, 0.0])
+        self.curvature = curvature
+        warp_grid_points(self.flat_points, self.black_hole_pos, curvature, out=self.warped_points)
+        corner_bezier_points(self.warped_points, out=self.curve_points)
+        # Animations such as FadeIn replace ``points``; re-attach the views.
+        for line, view in zip(self.grid_lines, self.line_views):
+            line.points = view
+        return self
 
 
 class GravitationalRedshiftScene(Scene):
@@ -233,7 +289,7 @@ class GravitationalRedshiftScene(Scene):
         self.play(FadeIn(spacetime_text), run_time=0.5)
         
         # Add spacetime grid
-        grid = SpacetimeGrid(black_hole_pos=black_hole.get_center(), curvature=0.5)
+        grid = LiveSpacetimeGrid(black_hole_pos=black_hole.get_center(), curvature=0.5)
         grid.set_opacity(0.5)
         self.play(FadeIn(grid), run_time=0.8)
         
@@ -292,10 +348,8 @@ class GravitationalRedshiftScene(Scene):
             run_time=1.0,
         )
         
-        # Increase curvature
-        new_grid = SpacetimeGrid(black_hole_pos=black_hole.get_center(), curvature=1.2)
-        new_grid.set_opacity(0.5)
-        self.play(Transform(grid, new_grid), run_time=0.8)
+        # Increase curvature - the live grid deepens continuously
+        self.play(grid.curvature_tracker.animate.set_value(1.2), run_time=0.8)
         
         # Light becomes infrared (invisible)
         invisible_text = Text("Light shifts to infrared (invisible!)", font_size=30, color=DARK_GREY)
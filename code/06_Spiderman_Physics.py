@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from studio.sprites import freeze
+from studio.text_cache import cached_text
+
 # TikTok 9:16 - use top 3/4 for content
 config.pixel_width = 1080
 config.pixel_height = 1920
@@ -41,7 +44,7 @@ class ProgressBar(VGroup):
             
             # Label (only for current)
             if i == current:
-                label = Text(section, font_size=20, color=WHITE, weight=BOLD)
+                label = cached_text(section, font_size=20, color=WHITE, weight=BOLD)
                 label.next_to(dot, DOWN, buff=0.15)
                 section_group.add(VGroup(dot, label))
             else:
@@ -95,6 +98,8 @@ class SpiderMan(VGroup):
         
         self.add(left_leg, right_leg, body, left_arm, right_arm, head, 
                 left_eye, right_eye, web1, web2, web3, web4)
+        # Only ever moved as a whole: blit from one cached raster
+        freeze(self)
 
 
 class Building(VGroup):
@@ -122,6 +127,8 @@ class Building(VGroup):
                 windows.add(window)
         
         self.add(building, windows)
+        # ~45 window paths that never change: blit from one cached raster
+        freeze(self)
 
 
 class CalculationBox(VGroup):
@@ -137,7 +144,7 @@ class CalculationBox(VGroup):
         )
         
         # Text
-        calc_text = Text(text, font_size=32, color=WHITE, weight=BOLD)
+        calc_text = cached_text(text, font_size=32, color=WHITE, weight=BOLD)
         calc_text.move_to(box)
         
         self.add(box, calc_text)
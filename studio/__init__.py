@@ -0,0 +1,4 @@
+"""Render tooling shared by the numbered scene bundles in ``code/``.
+
+Run ``python3 -m studio --help`` from the repository root for the CLI.
+"""
@@ -0,0 +1,387 @@
+"""Command line entry point: ``python3 -m studio <command>``."""
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from . import rng
+from .cache import RenderCache, cache_key
+from .discovery import REPO_ROOT, discover_jobs
+from .framing import FORMATS, bundle_format, framing_output_path
+from .profiler import PROFILE_DIR
+from .quality import DEFAULT_PROFILE, PROFILES
+from .render import quality_job, render_all
+from .service import SOCKET_PATH
+from .tex_cache import evict, warm
+
+
+def cmd_list(args):
+    for job in discover_jobs(args.targets):
+        print(f"{job.label:55} -> {job.output_path.name}")
+    return 0
+
+
+def warm_tex(jobs, workers=None):
+    modules = sorted({job.module_path for job in jobs})
+    counts, failures = warm(modules, workers=workers)
+    print(f"tex     {counts['hit']} cached, {counts['compiled']} compiled, {counts['failed']} failed")
+    for (expression, _), error in failures:
+        print(f"tex     FAILED {expression!r}: {error}", file=sys.stderr)
+    return failures
+
+
+def cmd_warm_tex(args):
+    failures = warm_tex(discover_jobs(args.targets), workers=args.jobs)
+    freed = evict()
+    if freed:
+        print(f"tex     evicted {freed / 2**20:.1f} MiB")
+    return 1 if failures else 0
+
+
+def shown(path):
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def framing_jobs(job, formats):
+    """The extra outputs a render of ``job`` writes for ``formats``, as jobs."""
+    native = bundle_format(job.module_path)
+    return [
+        dataclasses.replace(job, output_path=framing_output_path(job.output_path, name))
+        for name in formats if name != native
+    ]
+
+
+def cmd_render(args):
+    jobs = discover_jobs(args.targets)
+    if not jobs:
+        print("No scenes matched.", file=sys.stderr)
+        return 1
+    # Spawned workers read the profile from here; drafts never touch videos/
+    os.environ["STUDIO_QUALITY"] = args.quality
+    jobs = [quality_job(job, args.quality) for job in jobs]
+    if args.seed is not None:
+        # Spawned workers re-import studio.rng and read the seed from here
+        os.environ["STUDIO_SEED"] = str(args.seed)
+        rng.set_seed(args.seed)
+    if args.profile:
+        if args.chunk_size:
+            print("--profile is ignored with --chunk-size", file=sys.stderr)
+        else:
+            os.environ["STUDIO_PROFILE"] = "1"
+    formats = sorted(set(args.formats or ()))
+    if formats and (args.chunk_size or args.profile):
+        print("--formats is ignored with --chunk-size and --profile", file=sys.stderr)
+        formats = []
+    os.environ["STUDIO_FORMATS"] = ",".join(formats)
+    cache = RenderCache()
+    extra = {"seed": rng.get_seed()}
+    if args.quality != DEFAULT_PROFILE:
+        extra["quality"] = args.quality
+    if formats:
+        extra["formats"] = formats
+    keys = {job: cache_key(job, extra) for job in jobs}
+    extras = {job: framing_jobs(job, formats) for job in jobs}
+    stale = []
+    for job in jobs:
+        outputs = [job, *extras[job]]
+        if not (args.force or args.profile) and all(cache.is_fresh(output, keys[job]) for output in outputs):
+            print(f"cached  {job.label} -> {', '.join(shown(output.output_path) for output in outputs)}")
+        else:
+            stale.append(job)
+    if stale and not PROFILES[args.quality].tex_placeholders:
+        warm_tex(stale, workers=args.jobs)
+    try:
+        if args.chunk_size:
+            return render_stale_chunked(stale, cache, keys, args)
+        return render_stale(stale, cache, keys, extras, args)
+    finally:
+        evict()
+
+
+def render_stale(stale, cache, keys, extras, args):
+    failures = 0
+    for result in render_all(stale, processes=args.jobs):
+        job = result["job"]
+        if result["error"]:
+            failures += 1
+            print(f"FAILED  {job.label} ({result['seconds']:.1f}s)\n{result['error']}", file=sys.stderr)
+        else:
+            outputs = [job, *extras[job]]
+            for output in outputs:
+                cache.record(output, keys[job])
+            cache.save()
+            print(f"ok      {job.label} -> {', '.join(shown(output.output_path) for output in outputs)} ({result['seconds']:.1f}s)")
+            if args.profile:
+                print(f"profile {PROFILE_DIR / job.output_path.stem}.txt (+ .folded for flame graphs)")
+    return 1 if failures else 0
+
+
+def render_stale_chunked(stale, cache, keys, args):
+    from .chunked import render_chunked
+
+    failures = 0
+    for job in stale:
+        start = time.perf_counter()
+        try:
+            render_chunked(job, args.chunk_size, processes=args.jobs)
+        except Exception:
+            failures += 1
+            print(f"FAILED  {job.label} ({time.perf_counter() - start:.1f}s, chunked)\n{traceback.format_exc()}", file=sys.stderr)
+            continue
+        cache.record(job, keys[job])
+        cache.save()
+        print(f"ok      {job.label} -> {shown(job.output_path)} ({time.perf_counter() - start:.1f}s, chunked)")
+    return 1 if failures else 0
+
+
+def cmd_serve(args):
+    from .frames import FrameStream, serve, serve_socket
+
+    jobs = discover_jobs(args.targets)
+    if len(jobs) != 1:
+        print(f"serve streams one scene; {len(jobs)} matched: "
+              f"{', '.join(job.label for job in jobs) or 'none'}", file=sys.stderr)
+        return 1
+    os.environ["STUDIO_QUALITY"] = args.quality
+    if args.seed is not None:
+        rng.set_seed(args.seed)
+    if args.socket is None:
+        # Frames own stdout; anything else printing there (manim's logger,
+        # LaTeX) is sent to stderr instead
+        out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+        sys.stdout.flush()
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    stream = FrameStream(jobs[0])
+    target = args.socket or "stdout"
+    print(f"serve   {jobs[0].label}: {stream.width}x{stream.height} rgba @ {stream.frame_rate} fps -> {target}",
+          file=sys.stderr)
+    print(f"serve   e.g. ffmpeg {' '.join(stream.ffmpeg_input())} out.mp4", file=sys.stderr)
+    start = time.perf_counter()
+    try:
+        if args.socket is None:
+            with out:
+                frames = serve(stream, out.write, header=args.header)
+        else:
+            frames = serve_socket(stream, args.socket, header=args.header)
+    except (BrokenPipeError, ConnectionResetError):
+        print(f"serve   consumer went away after {stream.frames} frames", file=sys.stderr)
+        return 0
+    print(f"serve   {frames} frames in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_service(args):
+    import asyncio
+
+    from .service import run_service
+
+    def ready(service):
+        print(f"service listening on {shown(args.socket)} "
+              f"({service.workers} workers, {service.memory_mb:.0f} MiB budget)", file=sys.stderr)
+
+    try:
+        asyncio.run(run_service(args.socket, memory_mb=args.memory_mb, workers=args.jobs, on_ready=ready))
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_submit(args):
+    import asyncio
+
+    from .service import submit
+
+    request = {"targets": args.targets, "quality": args.quality, "seed": args.seed, "force": args.force}
+    progress = sys.stdout.isatty()
+
+    async def follow():
+        failures = 0
+        async for event in submit(request, args.socket):
+            name, label = event["event"], event.get("scene", "")
+            if name == "progress":
+                if progress:
+                    total = f"/{event['total']}" if event["total"] else ""
+                    print(f"\rrender  {label} {event['frames']}{total} frames", end="", flush=True)
+                continue
+            if progress:
+                print("\r\033[K", end="")
+            if name == "queued":
+                shared = ", joined an identical request" if event.get("deduplicated") else ""
+                print(f"queued  {label} (job {event['id']}{shared})")
+            elif name == "started":
+                print(f"start   {label} (job {event['id']})")
+            elif name == "cached":
+                print(f"cached  {label} -> {shown(Path(event['output']))}")
+            elif name == "done":
+                print(f"ok      {label} -> {shown(Path(event['output']))} ({event['seconds']:.1f}s)")
+            elif name == "failed":
+                failures += 1
+                print(f"FAILED  {label} (job {event['id']})\n{event['error']}", file=sys.stderr)
+            elif name == "error":
+                failures += 1
+                print(event["error"], file=sys.stderr)
+        return failures
+
+    try:
+        failures = asyncio.run(follow())
+    except (ConnectionRefusedError, FileNotFoundError):
+        print(f"no render service on {shown(args.socket)}; start one with python3 -m studio service", file=sys.stderr)
+        return 1
+    return 1 if failures else 0
+
+
+def cmd_jobs(args):
+    from .service import JobTable
+
+    for row in JobTable().recent(args.limit):
+        seconds = f"{row['finished'] - row['started']:.1f}s" if row["finished"] and row["started"] else ""
+        print(f"{row['id']:>5} {row['state']:9} {row['quality']:6} {row['scene']:55} {seconds:>8}")
+    return 0
+
+
+def cmd_bench(args):
+    from .bench import BenchHistory, compare, format_rows, machine, run_benchmarks
+
+    history = BenchHistory()
+    baseline = None if args.save_baseline else history.baseline
+    if baseline and baseline["machine"] != machine():
+        print("warning: baseline was recorded on a different machine or toolchain; "
+              "pass --save-baseline to reset it", file=sys.stderr)
+    results, errors = run_benchmarks(
+        args.targets, renders=not args.no_render, pattern=args.filter, processes=args.jobs,
+    )
+    rows = compare(results, baseline, args.threshold)
+    print(format_rows(rows))
+    for name, error in errors.items():
+        print(f"FAILED  {name}\n{error}", file=sys.stderr)
+    if not args.dry_run:
+        history.record(results, save_baseline=args.save_baseline)
+        history.save()
+    regressions = [row[0] for row in rows if row[-1]]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+    return 1 if regressions or errors else 0
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python3 -m studio")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = commands.add_parser("list", help="show the scenes found in code/")
+    list_cmd.add_argument("targets", nargs="*", help="bundle numbers, module names or scene names")
+    list_cmd.set_defaults(func=cmd_list)
+
+    render_cmd = commands.add_parser("render", help="render scenes into videos/")
+    render_cmd.add_argument("targets", nargs="*", help="bundle numbers, module names or scene names (default: all)")
+    render_cmd.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: one per core)")
+    render_cmd.add_argument("--force", action="store_true", help="ignore render_cache.json and re-render")
+    render_cmd.add_argument(
+        "--chunk-size", type=positive_int, default=None, metavar="N",
+        help="split each scene into chunks of N play() calls rendered in parallel",
+    )
+    render_cmd.add_argument(
+        "--profile", action="store_true",
+        help="re-render and write per-play timings to media/profiles/ (table + flame-graph stacks)",
+    )
+    render_cmd.add_argument(
+        "--quality", choices=list(PROFILES), default=DEFAULT_PROFILE,
+        help="draft (1/4 size, 15 fps, TeX placeholders) and review (1/2 size, 30 fps) "
+             "write to media/drafts/; final (default) fills videos/",
+    )
+    render_cmd.add_argument(
+        "--formats", nargs="+", choices=list(FORMATS), default=None, metavar="FORMAT",
+        help="also film each scene as landscape and/or portrait in the same pass, "
+             "into <video>_<format>.mp4 (bundles keep their own format in <video>.mp4)",
+    )
+    render_cmd.add_argument(
+        "--seed", type=int, default=None,
+        help="seed for every random stream in the render (default: $STUDIO_SEED or 0)",
+    )
+    render_cmd.set_defaults(func=cmd_render)
+
+    warm_cmd = commands.add_parser("warm-tex", help="precompile the TeX used by scenes into the shared cache")
+    warm_cmd.add_argument("targets", nargs="*", help="bundle numbers, module names or scene names (default: all)")
+    warm_cmd.add_argument("-j", "--jobs", type=int, default=None, help="parallel compiles (default: one per core)")
+    warm_cmd.set_defaults(func=cmd_warm_tex)
+
+    serve_cmd = commands.add_parser(
+        "serve", help="stream one scene's frames as raw RGBA to stdout or a UNIX socket, without encoding",
+    )
+    serve_cmd.add_argument("targets", nargs="+", help="bundle number, module name or scene name of one scene")
+    serve_cmd.add_argument(
+        "--socket", default=None, metavar="PATH",
+        help="listen on a UNIX socket at PATH and stream to the first client (default: stdout)",
+    )
+    serve_cmd.add_argument(
+        "--header", action="store_true",
+        help="start the stream with one JSON line giving width, height, frame rate and pixel format",
+    )
+    serve_cmd.add_argument("--quality", choices=list(PROFILES), default=DEFAULT_PROFILE, help="render quality profile")
+    serve_cmd.add_argument("--seed", type=int, default=None, help="seed for every random stream in the render")
+    serve_cmd.set_defaults(func=cmd_serve)
+
+    service_cmd = commands.add_parser(
+        "service", help="run the local render queue that submit (and other tools) send scenes to",
+    )
+    service_cmd.add_argument("--socket", type=Path, default=SOCKET_PATH, help="UNIX socket to listen on")
+    service_cmd.add_argument(
+        "--memory-mb", type=float, default=None,
+        help="start jobs only while their estimated memory fits in this many MiB (default: 3/4 of RAM)",
+    )
+    service_cmd.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: one per core)")
+    service_cmd.set_defaults(func=cmd_service)
+
+    submit_cmd = commands.add_parser("submit", help="queue renders on the render service and follow their progress")
+    submit_cmd.add_argument("targets", nargs="*", help="bundle numbers, module names or scene names (default: all)")
+    submit_cmd.add_argument("--quality", choices=list(PROFILES), default=DEFAULT_PROFILE, help="render quality profile")
+    submit_cmd.add_argument("--seed", type=int, default=None, help="seed for every random stream in the render")
+    submit_cmd.add_argument("--force", action="store_true", help="re-render even if the output is cached")
+    submit_cmd.add_argument("--socket", type=Path, default=SOCKET_PATH, help="UNIX socket of the service")
+    submit_cmd.set_defaults(func=cmd_submit)
+
+    jobs_cmd = commands.add_parser("jobs", help="list recent render service jobs")
+    jobs_cmd.add_argument("--limit", type=int, default=20, help="how many jobs to show (default: 20)")
+    jobs_cmd.set_defaults(func=cmd_jobs)
+
+    bench_cmd = commands.add_parser("bench", help="time helpers and preview renders against the recorded baseline")
+    bench_cmd.add_argument(
+        "targets", nargs="*",
+        help="bundle numbers, module names, scene names or 'studio' (default: everything)",
+    )
+    bench_cmd.add_argument("-k", "--filter", default=None, metavar="TEXT", help="only benchmarks whose name contains TEXT")
+    bench_cmd.add_argument("--no-render", action="store_true", help="skip the preview-resolution scene renders")
+    bench_cmd.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="fail when a benchmark is this much slower than the baseline (default: 0.25 = 25%%)",
+    )
+    bench_cmd.add_argument("--save-baseline", action="store_true", help="record this run as the new baseline")
+    bench_cmd.add_argument("--dry-run", action="store_true", help="compare without writing the history file")
+    bench_cmd.add_argument("-j", "--jobs", type=int, default=None, help="parallel scene renders (default: 1, for stable timings)")
+    bench_cmd.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""Benchmarks for the scene library, with a local history to catch regressions.
+
+Three kinds of benchmark, all CPU-only and headless:
+
+* ``studio`` micro-benchmarks of the NumPy hot paths (frequency responses,
+  adaptive sampling, Bezier builders, log downsampling), run in this process;
+* helper-class construction and hot helper methods of each bundle, run in a
+  fresh worker per bundle because every bundle edits ``config`` on import;
+* a full render of every scene at preview resolution (long side 854 px,
+  15 fps) into a throwaway media dir.
+
+Each timing is the best of a few repeats (the least noisy estimate on a
+shared machine). Results are appended to ``.cache/bench_history.json``;
+the first run, or any run with ``--save-baseline``, becomes the baseline,
+and a later result slower than the baseline by more than the threshold
+(and by more than ``MIN_DELTA`` seconds) counts as a regression.
+"""
+
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import timeit
+import traceback
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+
+from .discovery import REPO_ROOT
+
+HISTORY_PATH = REPO_ROOT / ".cache" / "bench_history.json"
+REPEATS = 5
+# Differences below this are timer noise, whatever the ratio
+MIN_DELTA = 1e-4
+PREVIEW_LONG_SIDE = 854
+PREVIEW_FRAME_RATE = 15
+
+# Pole/zero systems shaped like the stages of bundle 02
+SYSTEMS = [
+    (1.0, [], []),
+    (1.0, [-1.0], []),
+    (2.0, [-1.0, -2.0], []),
+    (2.0, [-1.0, -2.0], [-0.5]),
+    (1.0, [-0.5 + 1.5j, -0.5 - 1.5j], []),
+    (1.5, [-0.3 + 1.2j, -0.3 - 1.2j, -2.0], [-0.8]),
+    (1.8, [-0.2 + 1.0j, -0.2 - 1.0j, -1.5, -3.0], [-0.4 + 0.6j, -0.4 - 0.6j]),
+    (2.2, [-0.15 + 1.4j, -0.15 - 1.4j, -0.6 + 0.5j, -0.6 - 0.5j, -2.5], [-0.3, -1.2, -2.0]),
+]
+
+# (name, statement, setup); statements run in the namespace below
+STUDIO_BENCHMARKS = [
+    ("evaluate_systems 8x800",
+     "evaluate_systems(omega, SYSTEMS)",
+     "omega = np.logspace(-2.5, 1.5, 800)"),
+    ("Responses.phase 8x800",
+     "Responses(response).phase",
+     "response = evaluate_systems(np.logspace(-2.5, 1.5, 800), SYSTEMS)"),
+    ("adaptive_omega 8x200",
+     "adaptive_omega(SYSTEMS, budget=200, max_radius=3.0)",
+     ""),
+    ("FrequencyResponse sweep 200",
+     "cache = FrequencyResponse(omega)\n"
+     "for t in sweep: cache.evaluate([(1.0, [complex(-0.5, t), complex(-0.5, -t)], [])])",
+     "omega = np.logspace(-2.5, 1.5, 800); sweep = np.linspace(0.5, 2.0, 200)"),
+    ("corner_bezier_points 24x200",
+     "corner_bezier_points(points, out=out)",
+     "points = np.random.default_rng(0).random((24, 200, 3)); out = np.empty((24, 796, 3))"),
+    ("smooth_bezier_points 2000",
+     "smooth_bezier_points(points)",
+     "points = np.random.default_rng(0).random((2000, 3))"),
+    ("decimate_by_curvature 2000",
+     "decimate_by_curvature(points, 0.05)",
+     "t = np.linspace(0, 6, 2000); points = np.column_stack([t, np.sin(3 * t), 0 * t])"),
+    ("downsample_log 100k->500",
+     "downsample_log(points, 500)",
+     "rng = np.random.default_rng(0); x = np.arange(100_000.0)\n"
+     "points = list(zip(x.tolist(), (np.exp(-x / 2e4) + rng.normal(0, 0.05, x.size)).tolist()))"),
+]
+
+# Bundle number -> [(name, statement, setup)], run in that bundle's namespace
+BUNDLE_BENCHMARKS = {
+    "02": [
+        ("LivePoleZeroSystem", "LivePoleZeroSystem(omega, 5, 3)", "omega = np.logspace(-2.5, 1.5, 800)"),
+        ("LivePoleZeroSystem.update_response",
+         "system.log_gain_tracker.set_value(system.log_gain_tracker.get_value() + 1e-3)\n"
+         "system.update_response()",
+         "system = LivePoleZeroSystem(np.logspace(-2.5, 1.5, 800), 5, 3)\n"
+         "system.set_system(2.2, [-0.15 + 1.4j, -0.15 - 1.4j, -0.6 + 0.5j, -0.6 - 0.5j, -2.5], [-0.3, -1.2, -2.0])"),
+    ],
+    "03": [
+        ("TransformerNetwork", "TransformerNetwork()", ""),
+        ("TracedLossCurve", "TracedLossCurve()", ""),
+        ("TracedLossCurve.append x30",
+         "curve = TracedLossCurve()\nfor step in range(30): curve.append(step, 5 * 0.9 ** step)",
+         ""),
+        ("NeuronCloud 2000", "NeuronCloud(positions, BLUE_B)", "positions = np.random.default_rng(0).random((2000, 3))"),
+        ("blended_rgbas 2000", "blended_rgbas([BLUE_B, RED_C, GREEN_C], 2000, 0.85)", ""),
+    ],
+    "04": [
+        ("PhotonParticle", "PhotonParticle()", ""),
+        ("PionParticle", "PionParticle()", ""),
+    ],
+    "05": [
+        ("BlackHole", "BlackHole()", ""),
+        ("Astronaut", "Astronaut()", ""),
+        ("Torch", "Torch()", ""),
+        ("SpacetimeGrid", "SpacetimeGrid()", ""),
+        ("LiveSpacetimeGrid", "LiveSpacetimeGrid()", ""),
+        ("LiveSpacetimeGrid.update_warp",
+         "grid.curvature_tracker.increment_value(1e-3)\ngrid.update_warp()",
+         "grid = LiveSpacetimeGrid()"),
+        ("warp_grid_points 24x200",
+         "warp_grid_points(points, ORIGIN, 1.0, out=out)",
+         "points = SpacetimeGrid(samples=200).flat_points; out = np.empty_like(points)"),
+    ],
+    "06": [
+        ("ProgressBar", "ProgressBar(['Swing', 'Forces', 'Energy', 'Web', 'Result'], current=2)", ""),
+        ("SpiderMan", "SpiderMan()", ""),
+        ("Building", "Building()", ""),
+        ("CalculationBox", "CalculationBox('F = m v^2 / r')", ""),
+    ],
+}
+
+
+def best_time(statement, setup="", namespace=None, repeats=REPEATS):
+    """Best per-call seconds of ``statement`` over ``repeats`` timed batches.
+
+    The batch size is picked by ``Timer.autorange`` so fast statements are
+    timed over enough calls to rise above the timer resolution.
+    """
+    timer = timeit.Timer(statement, setup, globals=dict(namespace or {}))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeats, number)) / number
+
+
+def _time_all(benchmarks, namespace, prefix, pattern=None):
+    results, errors = {}, {}
+    for name, statement, setup in benchmarks:
+        name = f"{prefix}/{name}"
+        if pattern and pattern not in name:
+            continue
+        try:
+            results[name] = best_time(statement, setup, namespace)
+        except Exception:
+            errors[name] = traceback.format_exc()
+    return results, errors
+
+
+def studio_namespace():
+    import numpy as np
+
+    from .curves import corner_bezier_points, decimate_by_curvature, smooth_bezier_points
+    from .freq_response import FrequencyResponse, Responses, adaptive_omega, evaluate_systems
+    from .training_log import downsample_log
+
+    return {
+        "np": np, "SYSTEMS": SYSTEMS,
+        "corner_bezier_points": corner_bezier_points, "decimate_by_curvature": decimate_by_curvature,
+        "smooth_bezier_points": smooth_bezier_points, "FrequencyResponse": FrequencyResponse,
+        "Responses": Responses, "adaptive_omega": adaptive_omega, "evaluate_systems": evaluate_systems,
+        "downsample_log": downsample_log,
+    }
+
+
+def bench_studio(pattern=None):
+    return _time_all(STUDIO_BENCHMARKS, studio_namespace(), "studio", pattern)
+
+
+def _bench_bundle(task):
+    """Worker: import one bundle and time its helper benchmarks."""
+    from . import rng
+    from .render import load_module
+    from .tex_cache import use_tex_cache
+
+    module_path, pattern = task
+    try:
+        rng.seed_globals()
+        use_tex_cache()
+        module = load_module(module_path)
+    except Exception:
+        return {}, {module_path.stem: traceback.format_exc()}
+    number = module_path.stem.split("_")[0]
+    return _time_all(BUNDLE_BENCHMARKS[number], vars(module), module_path.stem, pattern)
+
+
+def use_preview_resolution(config):
+    """Scale the bundle's own resolution so its long side is 854 px, at 15 fps."""
+    scale = PREVIEW_LONG_SIDE / max(config.pixel_width, config.pixel_height)
+    config.pixel_width = round(config.pixel_width * scale)
+    config.pixel_height = round(config.pixel_height * scale)
+    config.frame_rate = PREVIEW_FRAME_RATE
+
+
+def _bench_render(task):
+    """Worker: render one scene at preview resolution and time ``scene.render()``."""
+    from .render import configure_worker, load_module
+
+    job, media_dir = task
+    name = f"render/{job.label}"
+    try:
+        from manim import config
+
+        configure_worker(job, media_dir)
+        config.disable_caching = True
+        module = load_module(job.module_path)
+        # Bundles set their resolution on import, so scale it down afterwards
+        use_preview_resolution(config)
+        from .renderers import StudioRenderer
+
+        scene = getattr(module, job.scene_name)(renderer=StudioRenderer())
+        start = time.perf_counter()
+        scene.render()
+        return {name: time.perf_counter() - start}, {}
+    except Exception:
+        return {}, {name: traceback.format_exc()}
+
+
+def run_benchmarks(targets=None, renders=True, pattern=None, processes=None):
+    """Run every selected benchmark; returns ``(results, errors)`` keyed by name.
+
+    ``targets`` are bundle/scene selectors as for ``render``, plus
+    ``studio`` for the micro-benchmarks; no targets means everything.
+    """
+    from .discovery import discover_jobs
+    from .render import run_in_pool
+
+    results, errors = {}, {}
+    targets = list(targets or [])
+    if not targets or "studio" in targets:
+        part_results, part_errors = bench_studio(pattern)
+        results.update(part_results)
+        errors.update(part_errors)
+    bundle_targets = [target for target in targets if target != "studio"]
+    if targets and not bundle_targets:
+        return results, errors
+
+    jobs = discover_jobs(bundle_targets)
+    tasks = [
+        (path, pattern) for path in sorted({job.module_path for job in jobs})
+        if path.stem.split("_")[0] in BUNDLE_BENCHMARKS
+    ]
+    # One bundle at a time: parallel workers would skew each other's timings
+    for part_results, part_errors in run_in_pool(_bench_bundle, tasks, processes=1, ordered=True):
+        results.update(part_results)
+        errors.update(part_errors)
+
+    if renders:
+        jobs = [job for job in jobs if not pattern or pattern in f"render/{job.label}"]
+        with tempfile.TemporaryDirectory(prefix="studio-bench-") as media_dir:
+            tasks = [(job, Path(media_dir)) for job in jobs]
+            for part_results, part_errors in run_in_pool(_bench_render, tasks, processes=processes or 1, ordered=True):
+                results.update(part_results)
+                errors.update(part_errors)
+    return results, errors
+
+
+def machine():
+    """What the timings depend on besides the code."""
+    import numpy as np
+
+    try:
+        manim_version = metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        manim_version = None
+    return {
+        "platform": platform.platform(), "processor": platform.processor() or platform.machine(),
+        "python": platform.python_version(), "numpy": np.__version__, "manim": manim_version,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class BenchHistory:
+    """``.cache/bench_history.json``: the baseline plus every recorded run."""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = Path(path)
+        if self.path.exists():
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        else:
+            self.data = {"baseline": None, "runs": []}
+
+    @property
+    def baseline(self):
+        return self.data["baseline"]
+
+    def record(self, results, save_baseline=False):
+        run = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "machine": machine(),
+            "results": results,
+        }
+        self.data["runs"].append(run)
+        if save_baseline or self.baseline is None:
+            self.data["baseline"] = run
+        else:
+            # Benchmarks added since the baseline was taken join it as they are first measured
+            for name, seconds in results.items():
+                self.baseline["results"].setdefault(name, seconds)
+        return run
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(results, baseline, threshold):
+    """Rows of ``(name, seconds, baseline_seconds, ratio, regressed)``, in name order."""
+    rows = []
+    for name in sorted(results):
+        seconds = results[name]
+        before = (baseline or {}).get("results", {}).get(name)
+        if before is None:
+            rows.append((name, seconds, None, None, False))
+            continue
+        ratio = seconds / before if before else float("inf")
+        regressed = ratio > 1 + threshold and seconds - before > MIN_DELTA
+        rows.append((name, seconds, before, ratio, regressed))
+    return rows
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_rows(rows):
+    lines = [f"{'benchmark':60} {'time':>10} {'baseline':>10} {'change':>8}"]
+    for name, seconds, before, ratio, regressed in rows:
+        change = "new" if ratio is None else f"{100 * (ratio - 1):+.0f}%"
+        flag = "  REGRESSION" if regressed else ""
+        lines.append(f"{name[:60]:60} {format_seconds(seconds):>10} {format_seconds(before):>10} {change:>8}{flag}")
+    return "\n".join(lines)
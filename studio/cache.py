@@ -0,0 +1,155 @@
+"""Content-addressed index of rendered videos.
+
+A scene's key hashes everything that can change its frames: the bundle
+source, the source of any ``studio`` helpers it imports, the render
+pipeline (``render.py``, ``chunked.py`` and the ``studio`` modules they
+use, such as the renderers, encoder and sprite camera), ``manim.cfg``, the
+module-level ``config.*`` assignments, and the installed manim and NumPy
+versions. The
+index lives in ``render_cache.json`` beside ``videos/`` so it can be
+committed and shared between CI and laptops.
+"""
+
+import ast
+import hashlib
+import json
+import os
+from importlib import metadata
+from pathlib import Path
+
+from .discovery import REPO_ROOT
+
+INDEX_PATH = REPO_ROOT / "render_cache.json"
+CACHE_VERSION = 1
+# Entry points of the worker-side render code, hashed with their imports
+PIPELINE_MODULES = (REPO_ROOT / "studio" / "render.py", REPO_ROOT / "studio" / "chunked.py")
+MANIM_CFG = REPO_ROOT / "manim.cfg"
+
+
+def _package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "missing"
+
+
+def module_config(tree):
+    """Module-level ``config.<name> = <literal>`` assignments, e.g. resolution."""
+    values = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if (
+                isinstance(target, ast.Attribute)
+                and isinstance(target.value, ast.Name)
+                and target.value.id == "config"
+            ):
+                try:
+                    values[target.attr] = ast.literal_eval(node.value)
+                except ValueError:
+                    values[target.attr] = ast.unparse(node.value)
+    return values
+
+
+def _imported_studio_modules(tree):
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                # Relative imports only occur inside the studio package itself.
+                module = ".".join(filter(None, ["studio", node.module]))
+            else:
+                module = node.module or ""
+            if module.split(".")[0] == "studio":
+                names.add(module)
+                names.update(f"{module}.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names if alias.name.split(".")[0] == "studio")
+    return names
+
+
+def studio_imports(tree):
+    """Source files of the ``studio`` modules a bundle imports, transitively."""
+    paths = set()
+    pending = [tree]
+    while pending:
+        for name in _imported_studio_modules(pending.pop()):
+            parts = name.split(".")
+            for path in (
+                REPO_ROOT.joinpath(*parts).with_suffix(".py"),
+                REPO_ROOT.joinpath(*parts, "__init__.py"),
+            ):
+                if path.exists() and path not in paths:
+                    paths.add(path)
+                    pending.append(ast.parse(path.read_bytes()))
+    return sorted(paths)
+
+
+def pipeline_sources():
+    """Source files of the render pipeline, plus ``manim.cfg`` when present."""
+    paths = set(PIPELINE_MODULES)
+    for path in PIPELINE_MODULES:
+        paths.update(studio_imports(ast.parse(path.read_bytes())))
+    if MANIM_CFG.exists():
+        paths.add(MANIM_CFG)
+    return sorted(paths)
+
+
+def cache_key(job, extra=None):
+    """Hex digest identifying the rendered output of ``job``.
+
+    ``extra`` is folded into the hash for render options that live outside
+    the bundle itself.
+    """
+    source = job.module_path.read_bytes()
+    tree = ast.parse(source)
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}\0{job.scene_name}\0".encode())
+    digest.update(source)
+    for path in sorted(set(studio_imports(tree)) | set(pipeline_sources())):
+        digest.update(path.relative_to(REPO_ROOT).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes())
+    settings = {
+        "config": module_config(tree),
+        "manim": _package_version("manim"),
+        "numpy": _package_version("numpy"),
+        "extra": extra or {},
+    }
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Maps each ``videos/`` slot to the key of the render that produced it."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("entries", {})
+
+    def _slot(self, job):
+        return job.output_path.name
+
+    def is_fresh(self, job, key):
+        """True when the slot's MP4 exists and was rendered from ``key``."""
+        entry = self.entries.get(self._slot(job))
+        if not entry or entry["key"] != key or not job.output_path.exists():
+            return False
+        return job.output_path.stat().st_size == entry["size"]
+
+    def record(self, job, key):
+        self.entries[self._slot(job)] = {
+            "key": key,
+            "scene": job.label,
+            "size": job.output_path.stat().st_size,
+        }
+
+    def save(self):
+        data = {"version": CACHE_VERSION, "entries": dict(sorted(self.entries.items()))}
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,100 @@
+"""Split one long scene into chunks of ``play`` calls rendered in parallel.
+
+Every chunk worker runs ``construct`` from the top. Plays before its chunk
+are skipped with manim's ``from_animation_number`` and the
+``FastForwardRenderer``, so they only advance mobject state; the plays in
+the chunk are rasterized and encoded; the scene stops at the chunk's end.
+The per-chunk movies share codec settings, so they are stitched with
+ffmpeg's concat demuxer and ``-c copy`` without re-encoding.
+
+Caveats: updaters that accumulate per frame (``TracedPath``) only tick once
+per skipped play, so a trail that is already on screen when a chunk starts
+can look sparser than in a single-process render. The stitched file carries
+the video stream only; scenes that call ``add_sound`` should be rendered
+unchunked.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+from .discovery import MEDIA_DIR
+from .render import configure_worker, load_bundle, run_in_pool
+
+CHUNK_DIR = MEDIA_DIR / "chunks"
+
+
+def chunk_ranges(total_plays, chunk_size):
+    """``(start, stop)`` play-index ranges covering ``total_plays``."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be at least 1, got {chunk_size}")
+    return [
+        (start, min(start + chunk_size, total_plays))
+        for start in range(0, total_plays, chunk_size)
+    ]
+
+
+def count_plays(job):
+    """Run ``construct`` without rasterizing and return its ``play`` count."""
+    from manim import config
+
+    from .renderers import FastForwardRenderer
+
+    configure_worker(job)
+    config.dry_run = True
+    module = load_bundle(job)
+    renderer = FastForwardRenderer(skip_animations=True)
+    getattr(module, job.scene_name)(renderer=renderer).render()
+    return renderer.num_plays
+
+
+def render_chunk(task):
+    """Render plays ``[start, stop)`` of a scene to its own movie file."""
+    job, index, start, stop = task
+    from manim import config
+
+    from .renderers import FastForwardRenderer
+
+    configure_worker(job)
+    # Chunks get private video dirs so their partial-movie lists never clash.
+    config.video_dir = str(CHUNK_DIR / job.module_path.stem / f"{index:03}")
+    config.output_file = f"{job.output_path.stem}_chunk{index:03}"
+    config.disable_caching = True
+    config.from_animation_number = start
+    module = load_bundle(job)
+    scene = getattr(module, job.scene_name)(renderer=FastForwardRenderer(stop_at=stop))
+    scene.render()
+    return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def stitch(movie_paths, output_path):
+    """Concatenate chunk movies into ``output_path`` without re-encoding."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is required to stitch chunked renders.")
+    output_path = Path(output_path)
+    list_path = output_path.with_suffix(".chunks.txt")
+    with list_path.open("w", encoding="utf-8") as fp:
+        for path in movie_paths:
+            fp.write(f"file 'file:{Path(path).resolve().as_posix()}'\n")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", str(list_path), "-c", "copy", "-an", str(output_path)],
+            check=True,
+        )
+    finally:
+        list_path.unlink()
+    return output_path
+
+
+def render_chunked(job, chunk_size, processes=None):
+    """Render ``job`` in chunks of ``chunk_size`` plays and fill its slot."""
+    (total_plays,) = run_in_pool(count_plays, [job], processes=1)
+    tasks = [
+        (job, index, start, stop)
+        for index, (start, stop) in enumerate(chunk_ranges(total_plays, chunk_size))
+    ]
+    movie_paths = list(run_in_pool(render_chunk, tasks, processes, ordered=True))
+    job.output_path.parent.mkdir(parents=True, exist_ok=True)
+    return stitch(movie_paths, job.output_path)
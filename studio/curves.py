@@ -0,0 +1,95 @@
+"""Build VMobject paths straight from point arrays.
+
+``ParametricFunction`` samples a Python callback once per point, and
+``set_points_as_corners`` on a list comprehension builds a Python list
+first. When the points already sit in an ``(N, 3)`` array, these helpers
+compute the cubic Bezier control points in a few whole-array operations
+and assign them to ``VMobject.points`` directly.
+"""
+
+import numpy as np
+
+
+def corner_bezier_points(points, out=None):
+    """Bezier control points for polylines, same as ``set_points_as_corners``.
+
+    ``points`` has shape (..., samples, 3); the result has shape
+    (..., 4 * (samples - 1), 3) so each row can be assigned to a VMobject.
+    Pass ``out`` to fill a preallocated array in place.
+    """
+    points = np.asarray(points, dtype=float)
+    samples = points.shape[-2]
+    if out is None:
+        out = np.empty((*points.shape[:-2], 4 * (samples - 1), 3))
+    curves = out.reshape(*points.shape[:-2], samples - 1, 4, 3)
+    start, end = points[..., :-1, :], points[..., 1:, :]
+    third = curves[..., 1, :]
+    np.subtract(end, start, out=third)
+    third /= 3
+    np.multiply(third, 2, out=curves[..., 2, :])
+    third += start
+    curves[..., 2, :] += start
+    curves[..., 0, :] = start
+    curves[..., 3, :] = end
+    return out
+
+
+def smooth_bezier_points(points, out=None):
+    """Bezier control points of a Catmull-Rom spline through ``points``.
+
+    Interior tangents are ``(p[i+1] - p[i-1]) / 2`` and end tangents are
+    one-sided, matching ``TracedLossCurve``. Shapes as in ``corner_bezier_points``.
+    """
+    points = np.asarray(points, dtype=float)
+    samples = points.shape[-2]
+    if out is None:
+        out = np.empty((*points.shape[:-2], 4 * (samples - 1), 3))
+    curves = out.reshape(*points.shape[:-2], samples - 1, 4, 3)
+    tangents = np.empty_like(points)
+    tangents[..., 1:-1, :] = (points[..., 2:, :] - points[..., :-2, :]) / 2
+    tangents[..., 0, :] = points[..., 1, :] - points[..., 0, :]
+    tangents[..., -1, :] = points[..., -1, :] - points[..., -2, :]
+    curves[..., 0, :] = points[..., :-1, :]
+    curves[..., 1, :] = points[..., :-1, :] + tangents[..., :-1, :] / 3
+    curves[..., 2, :] = points[..., 1:, :] - tangents[..., 1:, :] / 3
+    curves[..., 3, :] = points[..., 1:, :]
+    return out
+
+
+def decimate_by_curvature(points, tolerance):
+    """Drop samples along nearly straight stretches of an ``(N, 3)`` path.
+
+    A sample is kept once the heading has turned by ``tolerance`` radians
+    since the last kept sample, or when it is a corner sharper than that;
+    endpoints are always kept. Straight runs collapse to their ends while
+    tight bends keep every sample.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) < 3 or not tolerance:
+        return points
+    steps = np.diff(points, axis=0)
+    headings = np.arctan2(steps[:, 1], steps[:, 0])
+    turns = np.abs(np.angle(np.exp(1j * np.diff(headings))))
+    # Zero-length steps have no heading; treat them as straight
+    turns[(np.hypot(steps[:-1, 0], steps[:-1, 1]) == 0) | (np.hypot(steps[1:, 0], steps[1:, 1]) == 0)] = 0
+    buckets = np.floor(np.cumsum(turns) / tolerance)
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:-1] = (np.diff(buckets, prepend=0) > 0) | (turns >= tolerance)
+    return points[keep]
+
+
+def curve_from_points(points, smooth=False, tolerance=None, mobject=None, **kwargs):
+    """A VMobject through the ``(N, 3)`` array ``points``, with no per-point callbacks.
+
+    ``smooth`` fits a Catmull-Rom spline instead of corners, ``tolerance``
+    (radians) decimates flat stretches first, and ``mobject`` reuses an
+    existing VMobject instead of creating one. Other keyword arguments go
+    to ``VMobject``.
+    """
+    from manim import VMobject
+
+    if tolerance:
+        points = decimate_by_curvature(points, tolerance)
+    curve = mobject if mobject is not None else VMobject(**kwargs)
+    curve.points = (smooth_bezier_points if smooth else corner_bezier_points)(points)
+    return curve
@@ -0,0 +1,93 @@
+"""Find the numbered scene bundles in ``code/`` and the video slots they fill."""
+
+import ast
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CODE_DIR = REPO_ROOT / "code"
+VIDEOS_DIR = REPO_ROOT / "videos"
+MEDIA_DIR = REPO_ROOT / "media"
+
+# Bundles follow the XX_Name.py convention; anything else in code/ is a helper.
+BUNDLE_PATTERN = re.compile(r"^(\d+)_\w+\.py$")
+
+
+@dataclass(frozen=True)
+class SceneJob:
+    """One Scene subclass to render and the ``videos/`` slot it writes to."""
+    module_path: Path
+    scene_name: str
+    output_path: Path
+
+    @property
+    def label(self):
+        return f"{self.module_path.stem}:{self.scene_name}"
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+
+def find_scene_classes(module_path):
+    """Return the Scene subclasses defined in a module, without importing it.
+
+    Importing would pull in manim and run the module-level ``config`` edits,
+    so the class list is read from the AST instead. Any base whose name ends
+    in ``Scene`` (``Scene``, ``MovingCameraScene``, ...) counts, as does a
+    class derived from a scene defined earlier in the same file.
+    """
+    tree = ast.parse(Path(module_path).read_text(encoding="utf-8"))
+    scenes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [_base_name(base) for base in node.bases]
+        if any(base.endswith("Scene") or base in scenes for base in bases):
+            scenes.append(node.name)
+    return scenes
+
+
+def bundle_modules(code_dir=CODE_DIR):
+    """Numbered bundle modules in ``code_dir``, in bundle order."""
+    return sorted(
+        path for path in Path(code_dir).glob("*.py")
+        if BUNDLE_PATTERN.match(path.name)
+    )
+
+
+def _matches(path, scene_name, targets):
+    number = BUNDLE_PATTERN.match(path.name).group(1)
+    for target in targets:
+        if target in (number, path.stem, path.name, scene_name):
+            return True
+        if target == f"{path.stem}:{scene_name}":
+            return True
+    return False
+
+
+def discover_jobs(targets=None, code_dir=CODE_DIR, videos_dir=VIDEOS_DIR):
+    """Build a ``SceneJob`` for every scene in every bundle.
+
+    ``targets`` optionally narrows the list; each entry may be a bundle
+    number (``05``), a module stem or file name, a scene class name, or
+    ``stem:Scene``. A bundle with a single scene writes ``videos/XX_Name.mp4``;
+    bundles with several scenes get ``videos/XX_Name_Scene.mp4`` per scene.
+    """
+    jobs = []
+    for path in bundle_modules(code_dir):
+        scenes = find_scene_classes(path)
+        for scene_name in scenes:
+            if targets and not _matches(path, scene_name, targets):
+                continue
+            if len(scenes) == 1:
+                output_name = f"{path.stem}.mp4"
+            else:
+                output_name = f"{path.stem}_{scene_name}.mp4"
+            jobs.append(SceneJob(path, scene_name, Path(videos_dir) / output_name))
+    return jobs
@@ -0,0 +1,200 @@
+"""Encode movie segments in a separate process fed through shared memory.
+
+Stock manim pipes every frame to ffmpeg from the render loop. It copies
+each frame twice first (``get_frame`` and ``tobytes``), and at the end of
+every ``play`` it waits for ffmpeg to flush and finish that partial movie
+before the next ``play`` may start drawing. At 60 fps and 1080p
+(``01``, ``02``) that leaves the render idle for much of the time.
+
+``EncoderProcess`` moves all of that out of the render process:
+
+* Frames are copied once into a ring of ``RING_SLOTS`` shared-memory slots
+  and announced on a queue. The render only blocks when it is a whole
+  ring ahead of the encoder.
+* The encoder process streams each slot to the ffmpeg of the current
+  segment (one per ``play``). A frame held for a ``wait`` is one slot sent
+  ``count`` times.
+* The last frame stays in its slot, so a frame the renderer knows to be
+  unchanged (``repeat``) costs a message, not a copy.
+* Closing a segment only closes that ffmpeg's input. Up to
+  ``PARALLEL_SEGMENTS`` segments finish encoding side by side while
+  frames for the next one arrive, and ``drain`` waits for all of them.
+
+Segments stay manim's partial movie files, so the final concatenation is
+still manim's stream copy (``-c copy``) with no re-encode.
+"""
+
+import queue
+import subprocess
+from collections import deque
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+# Frames the render may run ahead of the encoder (8 x 8 MB at 1080p)
+RING_SLOTS = 8
+# Closed segments allowed to finish encoding concurrently
+PARALLEL_SEGMENTS = 4
+# Seconds between checks that the encoder process is still alive
+POLL_SECONDS = 1.0
+
+
+def _finish(segment, failures):
+    process, path = segment
+    if process.wait():
+        failures.append(f"{path} (ffmpeg exit {process.returncode})")
+
+
+def _send(active, frame, count, closing):
+    """Write ``frame`` ``count`` times to the active segment; returns it, or ``None`` if ffmpeg died."""
+    if active is None:
+        return None
+    try:
+        for _ in range(count):
+            active[0].stdin.write(frame)
+    except BrokenPipeError:
+        # Its exit status is reported when the segments are drained
+        closing.append(active)
+        return None
+    return active
+
+
+def encoder_main(ring_name, frame_bytes, parallel, commands, free, results):
+    """Encoder process: run one ffmpeg per segment, fed from the ring."""
+    # Spawned children share the parent's resource tracker, so attaching
+    # here does not hand the ring's cleanup to this process
+    ring = shared_memory.SharedMemory(name=ring_name)
+    buffer = ring.buf
+    active = None       # (Popen, path) receiving frames, or None
+    held = None         # slot of the last frame, kept for "repeat"
+    closing = deque()   # segments whose input is closed, still encoding
+    failures = []
+
+    def slot_view(slot):
+        return buffer[slot * frame_bytes:(slot + 1) * frame_bytes]
+
+    try:
+        while True:
+            command = commands.get()
+            if command is None:
+                break
+            kind = command[0]
+            if kind == "frame":
+                _, slot, count = command
+                with slot_view(slot) as frame:
+                    active = _send(active, frame, count, closing)
+                if held is not None:
+                    free.release()
+                held = slot
+            elif kind == "repeat":
+                if held is None:
+                    # Dropping them would shorten the movie without a trace
+                    path = active[1] if active is not None else "no segment"
+                    failures.append(f"{path} ({command[1]} repeated frames before any frame)")
+                    continue
+                with slot_view(held) as frame:
+                    active = _send(active, frame, command[1], closing)
+            elif kind == "open":
+                _, argv, path = command
+                while len(closing) >= parallel:
+                    _finish(closing.popleft(), failures)
+                active = (subprocess.Popen(argv, stdin=subprocess.PIPE), path)
+            elif kind == "close":
+                if held is not None:
+                    free.release()
+                    held = None
+                if active is not None:
+                    try:
+                        active[0].stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    closing.append(active)
+                    active = None
+            elif kind == "drain":
+                while closing:
+                    _finish(closing.popleft(), failures)
+                results.put(failures)
+                failures = []
+    finally:
+        buffer = None
+        ring.close()
+
+
+class EncoderProcess:
+    """Handle on an encoder process and the frame ring it reads from."""
+
+    def __init__(self, frame_bytes, slots=RING_SLOTS, parallel=PARALLEL_SEGMENTS):
+        context = get_context("spawn")
+        self.frame_bytes = frame_bytes
+        self.slots = slots
+        self.ring = shared_memory.SharedMemory(create=True, size=frame_bytes * slots)
+        self.free = context.Semaphore(slots)
+        self.commands = context.SimpleQueue()
+        self.results = context.Queue()
+        self.process = context.Process(
+            target=encoder_main,
+            args=(self.ring.name, frame_bytes, parallel, self.commands, self.free, self.results),
+            name="studio-encoder", daemon=True,
+        )
+        self.process.start()
+        self.next_slot = 0
+        self.pending_repeats = 0
+        # Whether the open segment has a frame that ``repeat`` can resend
+        self.has_frame = False
+
+    def _check_alive(self):
+        if not self.process.is_alive():
+            raise RuntimeError(f"encoder process exited with status {self.process.exitcode}")
+
+    def open(self, argv, path):
+        """Start a segment: ``argv`` is an ffmpeg command reading raw frames from stdin."""
+        self.commands.put(("open", list(argv), str(path)))
+
+    def write(self, frame, count=1):
+        """Queue ``frame`` (a C-contiguous pixel array) for ``count`` consecutive frames."""
+        self._flush_repeats()
+        while not self.free.acquire(timeout=POLL_SECONDS):
+            self._check_alive()
+        slot = self.next_slot
+        start = slot * self.frame_bytes
+        self.ring.buf[start:start + self.frame_bytes] = memoryview(np.ascontiguousarray(frame)).cast("B")
+        self.commands.put(("frame", slot, count))
+        self.next_slot = (slot + 1) % self.slots
+        self.has_frame = True
+
+    def repeat(self, count=1):
+        """Repeat the last frame written ``count`` more times, without copying it again."""
+        if not self.has_frame:
+            raise RuntimeError("repeat before any frame was written to the segment")
+        self.pending_repeats += count
+
+    def _flush_repeats(self):
+        # Consecutive repeats travel as one message
+        if self.pending_repeats:
+            self.commands.put(("repeat", self.pending_repeats))
+            self.pending_repeats = 0
+
+    def close_segment(self):
+        self._flush_repeats()
+        self.commands.put(("close",))
+        self.has_frame = False
+
+    def drain(self):
+        """Wait until every segment so far is encoded; raise if any failed."""
+        self._flush_repeats()
+        self.commands.put(("drain",))
+        while True:
+            try:
+                failures = self.results.get(timeout=POLL_SECONDS)
+                break
+            except queue.Empty:
+                self._check_alive()
+        if failures:
+            raise RuntimeError(f"encoding failed: {', '.join(failures)}")
+
+    def shutdown(self):
+        if self.process.is_alive():
+            self.commands.put(None)
+            self.process.join()
+        self.ring.close()
+        self.ring.unlink()
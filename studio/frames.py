@@ -0,0 +1,137 @@
+"""Stream a scene's frames as raw RGBA instead of encoding an MP4.
+
+``FrameStream(job)`` loads a bundle in this process and, when iterated,
+renders the scene on a background thread with ``FrameServerRenderer``.
+Each frame is yielded as a flat ``memoryview`` over the camera's pixel
+array (``height * width * 4`` bytes, rows top to bottom), without a copy.
+The render thread waits until the consumer asks for the next frame before
+drawing it, so a slow consumer paces the render and the view stays valid
+until then. Copy it (``bytes(view)``, ``np.array(...)``) to keep it longer.
+
+``serve`` writes the stream to anything with a blocking ``write``: stdout,
+a pipe into ffmpeg or a UNIX socket connection. A full pipe or socket
+buffer blocks the write, which blocks the render: backpressure end to end.
+Nothing is written under ``media/``.
+"""
+
+import json
+import os
+import queue
+import socket
+import threading
+
+from .discovery import MEDIA_DIR
+from .render import configure_worker, load_bundle
+
+_DONE = object()
+
+
+class FrameStream:
+    """The frames of one scene, rendered as they are consumed."""
+
+    def __init__(self, job, media_dir=MEDIA_DIR):
+        from manim import config
+
+        from .renderers import FrameServerRenderer
+
+        configure_worker(job, media_dir)
+        module = load_bundle(job)
+        # No movie, no partial-movie hashing, no files
+        config.dry_run = True
+        config.disable_caching = True
+        self.job = job
+        self.width = config.pixel_width
+        self.height = config.pixel_height
+        self.frame_rate = config.frame_rate
+        self.frames = 0
+        self.scene = getattr(module, job.scene_name)(renderer=FrameServerRenderer(self._hand_over))
+        self._ready = queue.Queue()
+        self._consumed = threading.Semaphore(0)
+        self._closed = False
+        self._error = None
+
+    @property
+    def frame_bytes(self):
+        return self.width * self.height * 4
+
+    def header(self):
+        """One JSON line describing the raw frames that follow."""
+        return (json.dumps({
+            "scene": self.job.label, "width": self.width, "height": self.height,
+            "frame_rate": self.frame_rate, "pix_fmt": "rgba",
+        }) + "\n").encode("utf-8")
+
+    def ffmpeg_input(self):
+        """ffmpeg arguments that read this stream from stdin."""
+        return [
+            "-f", "rawvideo", "-pix_fmt", "rgba",
+            "-s", f"{self.width}x{self.height}", "-r", str(self.frame_rate), "-i", "-",
+        ]
+
+    def _hand_over(self, pixels, count):
+        # Render thread: park until the consumer has finished with the frame
+        if not self._closed:
+            self._ready.put((pixels, count))
+            self._consumed.acquire()
+        if self._closed:
+            from manim.utils.exceptions import EndSceneEarlyException
+
+            raise EndSceneEarlyException()
+
+    def _render(self):
+        try:
+            self.scene.render()
+        except BaseException as error:
+            self._error = error
+        finally:
+            self._ready.put(_DONE)
+
+    def __iter__(self):
+        thread = threading.Thread(target=self._render, name=f"render {self.job.label}", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = self._ready.get()
+                if item is _DONE:
+                    break
+                pixels, count = item
+                view = memoryview(pixels).cast("B")
+                for _ in range(count):
+                    self.frames += 1
+                    yield view
+                self._consumed.release()
+        finally:
+            # Also reached when the consumer stops early: end the scene
+            self._closed = True
+            self._consumed.release()
+            thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def serve(stream, write, header=False):
+    """Pass every frame of ``stream`` to ``write`` (blocking); returns the frame count."""
+    if header:
+        write(stream.header())
+    frames = iter(stream)
+    try:
+        for view in frames:
+            write(view)
+    finally:
+        frames.close()
+    return stream.frames
+
+
+def serve_socket(stream, path, header=False):
+    """Serve ``stream`` to the first client of a UNIX socket at ``path``."""
+    if os.path.exists(path):
+        os.unlink(path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen(1)
+        try:
+            connection, _ = server.accept()
+            with connection:
+                return serve(stream, connection.sendall, header=header)
+        finally:
+            os.unlink(path)
@@ -0,0 +1,117 @@
+"""Output framings: one scene timeline rendered as landscape and portrait video.
+
+Bundles are authored for one format: ``01``/``02`` are 16:9 landscape,
+``03``-``06`` are 9:16 portrait with content kept between
+``TOP_REGION_BOTTOM`` and ``TOP_REGION_TOP``. Instead of duplicating
+scenes, ``MultiFramingRenderer`` (in ``renderers``) points extra cameras at
+the same mobjects: animations and updaters run once per frame, and each
+extra framing only re-rasterizes and encodes its own view.
+
+A framing is the smallest window of its aspect ratio that contains the
+bundle's focus region, centred on it. The focus is ``FRAMING_FOCUS``
+(``(left, right, bottom, top)`` in scene units) when the bundle defines
+one, otherwise the ``TOP_REGION`` band across the frame width, otherwise
+the whole frame. A wider window also shows what lies just outside the
+authored frame, so a bundle whose mobjects wait off-screen before sliding
+in should define ``FRAMING_FOCUS`` to suit.
+"""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# Format name -> native pixel size
+FORMATS = {
+    "landscape": (1920, 1080),
+    "portrait": (1080, 1920),
+}
+# Breathing room around the focus region, in scene units
+FOCUS_MARGIN = 0.75
+
+
+@dataclass(frozen=True)
+class Framing:
+    name: str
+    pixel_width: int
+    pixel_height: int
+    frame_width: float
+    frame_height: float
+    frame_center: tuple = (0.0, 0.0, 0.0)
+
+    def camera_kwargs(self):
+        return {
+            "pixel_width": self.pixel_width, "pixel_height": self.pixel_height,
+            "frame_width": self.frame_width, "frame_height": self.frame_height,
+            "frame_center": np.array(self.frame_center),
+        }
+
+
+def native_format(config):
+    return "landscape" if config.pixel_width >= config.pixel_height else "portrait"
+
+
+def bundle_format(module_path):
+    """The format a bundle is authored in, read from its ``config`` edits without importing it."""
+    from .cache import module_config
+
+    settings = module_config(ast.parse(Path(module_path).read_bytes()))
+    # manim's defaults are landscape
+    width, height = settings.get("pixel_width", 1920), settings.get("pixel_height", 1080)
+    return "landscape" if width >= height else "portrait"
+
+
+def focus_region(module, config):
+    """``(left, right, bottom, top)`` that every framing of ``module`` must show."""
+    focus = getattr(module, "FRAMING_FOCUS", None)
+    if focus is not None:
+        return tuple(focus)
+    half_width, half_height = config.frame_width / 2, config.frame_height / 2
+    top = getattr(module, "TOP_REGION_TOP", None)
+    bottom = getattr(module, "TOP_REGION_BOTTOM", None)
+    if top is None or bottom is None:
+        return -half_width, half_width, -half_height, half_height
+    return (
+        -half_width, half_width,
+        max(bottom - FOCUS_MARGIN, -half_height), min(top + FOCUS_MARGIN, half_height),
+    )
+
+
+def _even(value):
+    # H.264 wants even frame dimensions
+    return max(2, 2 * round(value / 2))
+
+
+def fit_framing(name, focus, long_side):
+    """The ``name`` framing around ``focus``, ``long_side`` pixels on its long edge."""
+    native_width, native_height = FORMATS[name]
+    aspect = native_width / native_height
+    left, right, bottom, top = focus
+    width, height = right - left, top - bottom
+    if width / height > aspect:
+        frame_width, frame_height = width, width / aspect
+    else:
+        frame_width, frame_height = height * aspect, height
+    scale = long_side / max(native_width, native_height)
+    return Framing(
+        name=name,
+        pixel_width=_even(native_width * scale),
+        pixel_height=_even(native_height * scale),
+        frame_width=frame_width,
+        frame_height=frame_height,
+        frame_center=((left + right) / 2, (bottom + top) / 2, 0.0),
+    )
+
+
+def extra_framings(module, config, formats):
+    """Framings for every format in ``formats`` other than the bundle's own."""
+    native = native_format(config)
+    focus = focus_region(module, config)
+    long_side = max(config.pixel_width, config.pixel_height)
+    return [fit_framing(name, focus, long_side) for name in dict.fromkeys(formats) if name != native]
+
+
+def framing_output_path(output_path, name):
+    """``videos/05_X.mp4`` -> ``videos/05_X_landscape.mp4``."""
+    return output_path.with_name(f"{output_path.stem}_{name}{output_path.suffix}")
@@ -0,0 +1,205 @@
+"""Batched frequency response of pole/zero systems.
+
+``H(jw) = K * prod(jw - z) / prod(jw - p)`` is evaluated for many systems
+at once: pole and zero sets are padded into ``(systems, roots)`` arrays
+(padding contributes a factor of 1) and each root slot multiplies into a
+``(systems, frequencies)`` product, so the Python loop runs over the few
+root slots rather than over systems. Results are cached
+per system, keyed by gain and the sorted pole/zero sets, so sweeps that
+revisit a system, or re-evaluate stages, only compute what is new.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Responses:
+    """Per-system rows over the shared frequency grid.
+
+    ``response`` is the complex ``H(jw)``, shape ``(systems, frequencies)``;
+    the derived views are computed on first access.
+    """
+
+    response: np.ndarray
+
+    def __len__(self):
+        return len(self.response)
+
+    @cached_property
+    def magnitude(self):
+        return np.abs(self.response)
+
+    @cached_property
+    def phase(self):
+        """Phase unwrapped along frequency."""
+        return unwrapped_phase(self.response)
+
+    @cached_property
+    def nyquist(self):
+        """``(systems, frequencies, 2)`` real/imaginary coordinates."""
+        return np.stack([self.response.real, self.response.imag], axis=-1)
+
+
+def system_key(K, poles=(), zeros=()):
+    """Hashable, order-independent identity of a (K, poles, zeros) system."""
+    def roots(values):
+        return tuple(sorted((complex(v) for v in values), key=lambda c: (c.real, c.imag)))
+    return float(K), roots(poles or ()), roots(zeros or ())
+
+
+def _padded(root_sets):
+    """Stack ragged root lists into ``(n, width)`` values and a validity mask."""
+    width = max((len(roots) for roots in root_sets), default=0)
+    values = np.zeros((len(root_sets), width), dtype=complex)
+    mask = np.zeros((len(root_sets), width), dtype=bool)
+    for row, roots in enumerate(root_sets):
+        values[row, :len(roots)] = roots
+        mask[row, :len(roots)] = True
+    return values, mask
+
+
+def _root_product(s, root_sets):
+    """``prod(s - r)`` for each root set, as an ``(n, N)`` array."""
+    values, mask = _padded(root_sets)
+    product = np.ones((len(root_sets), s.shape[-1]), dtype=complex)
+    # Loop over root slots (a handful), never over systems
+    for slot in range(values.shape[1]):
+        factor = s - values[:, slot, None]
+        factor[~mask[:, slot]] = 1.0
+        product *= factor
+    return product
+
+
+def evaluate_systems(omega, systems):
+    """Complex ``H(jw)`` for every ``(K, poles, zeros)`` in ``systems``, shape ``(n, N)``.
+
+    ``omega`` is one ``(N,)`` grid shared by all systems or an ``(n, N)``
+    grid per system (see ``adaptive_omega``).
+    """
+    s = 1j * np.asarray(omega, dtype=float)
+    gains = np.array([K for K, _, _ in systems], dtype=float)
+    numerator = _root_product(s, [zeros for _, _, zeros in systems])
+    denominator = _root_product(s, [poles for _, poles, _ in systems])
+    return gains[:, None] * numerator / denominator
+
+
+def unwrapped_phase(response):
+    """``np.unwrap(np.angle(response), axis=-1)`` without its temporaries."""
+    phase = np.angle(response)
+    jumps = np.round(np.diff(phase, axis=-1) / (2 * np.pi))
+    phase[..., 1:] -= 2 * np.pi * np.cumsum(jumps, axis=-1)
+    return phase
+
+
+class FrequencyResponse:
+    """Cached, batched frequency responses over one frequency grid."""
+
+    def __init__(self, omega, maxsize=4096):
+        self.omega = np.asarray(omega, dtype=float)
+        self.maxsize = maxsize
+        self._rows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, systems):
+        """``Responses`` for ``systems``, a sequence of ``(K, poles, zeros)``.
+
+        Uncached systems are computed together in a single batched pass.
+        """
+        keys = [system_key(*system) for system in systems]
+        missing = list(dict.fromkeys(key for key in keys if key not in self._rows))
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            computed = evaluate_systems(self.omega, missing)
+            self._rows.update(zip(missing, computed))
+        if missing == keys:
+            response = computed
+        else:
+            response = np.array([self._rows[key] for key in keys]).reshape(len(keys), len(self.omega))
+
+        for key in keys:
+            self._rows.move_to_end(key)
+        while len(self._rows) > self.maxsize:
+            self._rows.popitem(last=False)
+
+        return Responses(response)
+
+    def __call__(self, K, poles=(), zeros=()):
+        """``(magnitude, phase)`` of a single system."""
+        responses = self.evaluate([(K, poles, zeros)])
+        return responses.magnitude[0], responses.phase[0]
+
+
+def dc_gain(K, poles=(), zeros=()):
+    """``H(0)`` of ``K * prod(s - z) / prod(s - p)``, the gain of its Bode form."""
+    return K * np.prod(-np.asarray(zeros, dtype=complex)) / np.prod(-np.asarray(poles, dtype=complex))
+
+
+def _weighted_log_factors(s, roots, weights):
+    roots = np.asarray(roots, dtype=complex)
+    if not len(roots):
+        return 0.0
+    factors = 1 - s / roots[:, None]
+    logs = np.log(np.abs(factors)) + 1j * np.unwrap(np.angle(factors), axis=-1)
+    return np.asarray(weights, dtype=float) @ logs
+
+
+def weighted_log_response(omega, log_gain, poles, pole_weights, zeros, zero_weights):
+    """``log H(jw)`` with every root's factor raised to a weight in ``[0, 1]``.
+
+    Uses the Bode form ``exp(log_gain) * prod(1 - s/z)**wz / prod(1 - s/p)**wp``
+    (``log_gain`` is the log of ``dc_gain``), in which a root of weight 0
+    contributes exactly nothing, so roots can fade in and out while others
+    move. Each factor's phase is unwrapped along frequency, so the imaginary
+    part is already the continuous phase. Roots must be non-zero.
+    """
+    s = 1j * np.asarray(omega, dtype=float)
+    return (
+        log_gain
+        + _weighted_log_factors(s, zeros, zero_weights)
+        - _weighted_log_factors(s, poles, pole_weights)
+    )
+
+
+def adaptive_omega(systems, budget=256, band=(-2.5, 1.5), max_radius=None,
+                   phase_weight=0.5, turn_weight=1.0, density=4096):
+    """Per-system frequency grids concentrated where the Nyquist curve moves.
+
+    Each system is evaluated on a dense log grid over ``band`` (decades);
+    ``budget`` frequencies are then placed at equal steps of cumulative
+    "motion" along the displayed curve (magnitude clipped at ``max_radius``):
+    arc length, plus ``phase_weight`` times the phase change, plus
+    ``turn_weight`` times the change in heading (radians), plus a small
+    uniform floor so flat stretches keep a few samples. Sharp resonances
+    and tight bends get most of the budget, flat tails very little.
+    Returns an ``(n, budget)`` array to pass to ``evaluate_systems``.
+    """
+    log_dense = np.linspace(*band, density)
+    response = evaluate_systems(10.0 ** log_dense, systems)
+    radius = np.abs(response)
+    if max_radius is not None:
+        np.minimum(radius, max_radius, out=radius)
+    phase = unwrapped_phase(response)
+    steps = np.diff(radius * np.exp(1j * phase), axis=-1)
+
+    # Turning at each dense sample, split between its two intervals
+    turns = np.abs(np.diff(np.unwrap(np.angle(steps), axis=-1), axis=-1))
+    interval_turns = np.zeros_like(steps.real)
+    interval_turns[:, :-1] += turns / 2
+    interval_turns[:, 1:] += turns / 2
+
+    motion = np.abs(steps) + phase_weight * np.abs(np.diff(phase, axis=-1)) + turn_weight * interval_turns
+    # Floor (and a tiny epsilon for constant systems) keeps the map increasing
+    motion += 0.1 * motion.mean(axis=-1, keepdims=True) + 1e-12
+    progress = np.concatenate([np.zeros((len(systems), 1)), np.cumsum(motion, axis=-1)], axis=-1)
+
+    omegas = np.empty((len(systems), budget))
+    for row, cumulative in enumerate(progress):
+        targets = np.linspace(0, cumulative[-1], budget)
+        omegas[row] = 10.0 ** np.interp(targets, cumulative, log_dense)
+    return omegas
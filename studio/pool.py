@@ -0,0 +1,99 @@
+"""Reusable instances for short-lived mobjects (particles, waves, sparks).
+
+Effects that spawn a handful of mobjects per beat and drop them a moment
+later pay for construction every time: a ``Dot`` builds its arc points and
+style arrays, and ``.animate`` deep-copies it again for the target.
+``MobjectPool`` builds each instance once and hands it out again after it
+is released, reset to the state it was built in. The caller then only
+positions it and drives it with an ``UpdateFromAlphaFunc`` or similar.
+
+Resetting restores every family member's points, colour arrays and stroke
+widths in place, so a recycled instance is indistinguishable from a new
+one. ``info()`` reports how many were built and the most ever out at once
+(the high-water mark), which is the size to ``prefill`` with.
+"""
+
+# Per-member state restored on acquire
+_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+_SCALARS = ("stroke_width", "background_stroke_width", "z_index")
+
+
+def _snapshot(mobject):
+    state = []
+    for member in mobject.get_family():
+        arrays = {name: getattr(member, name).copy() for name in _ARRAYS if hasattr(member, name)}
+        scalars = {name: getattr(member, name) for name in _SCALARS if hasattr(member, name)}
+        state.append((member, arrays, scalars))
+    return state
+
+
+def _restore(state):
+    for member, arrays, scalars in state:
+        for name, pristine in arrays.items():
+            current = getattr(member, name)
+            if current.shape == pristine.shape:
+                current[...] = pristine
+            else:
+                setattr(member, name, pristine.copy())
+        for name, value in scalars.items():
+            setattr(member, name, value)
+
+
+class MobjectPool:
+    """Free list of ``factory()`` mobjects, reset to their built state on reuse."""
+
+    def __init__(self, factory, prefill=0):
+        self.factory = factory
+        self._free = []
+        self._free_ids = set()
+        self._pristine = {}
+        self.created = 0
+        self.in_use = 0
+        self.high_water = 0
+        for _ in range(prefill):
+            mobject = self._build()
+            self._free.append(mobject)
+            self._free_ids.add(id(mobject))
+
+    def _build(self):
+        mobject = self.factory()
+        self._pristine[id(mobject)] = _snapshot(mobject)
+        self.created += 1
+        return mobject
+
+    def acquire(self, count=None):
+        """One reset instance, or a list of ``count`` of them."""
+        if count is None:
+            return self.acquire(1)[0]
+        mobjects = []
+        for _ in range(count):
+            if self._free:
+                mobject = self._free.pop()
+                self._free_ids.discard(id(mobject))
+                _restore(self._pristine[id(mobject)])
+            else:
+                mobject = self._build()
+            mobjects.append(mobject)
+        self.in_use += count
+        self.high_water = max(self.high_water, self.in_use)
+        return mobjects
+
+    def release(self, *mobjects):
+        """Return instances for reuse; remove them from the scene first."""
+        for mobject in mobjects:
+            if id(mobject) not in self._pristine:
+                raise ValueError(f"{type(mobject).__name__} was not acquired from this pool")
+            if id(mobject) in self._free_ids:
+                raise ValueError(f"{type(mobject).__name__} was already released to this pool")
+        if len(set(map(id, mobjects))) != len(mobjects):
+            raise ValueError("the same instance was released twice")
+        for mobject in mobjects:
+            self._free.append(mobject)
+            self._free_ids.add(id(mobject))
+        self.in_use -= len(mobjects)
+
+    def info(self):
+        return {
+            "created": self.created, "free": len(self._free),
+            "in_use": self.in_use, "high_water": self.high_water,
+        }
@@ -0,0 +1,91 @@
+"""Per-``play`` render profiles: where a scene's render time goes.
+
+``ProfilingRenderer`` (in ``renderers``) fills one ``PlayProfile`` per
+``self.play``/``self.wait`` call: the scene-code call site and its caller
+chain, animation and mobject/point counts, wall time split into update
+(animation interpolation and updaters), rasterize (Cairo) and encode
+(piping frames to ffmpeg), and the process's peak RSS afterwards.
+
+``write_reports`` turns them into a sorted text table and a collapsed-stack
+file (``scene;caller:line;play:line;phase microseconds``) that
+``flamegraph.pl``, speedscope or inferno can render directly.
+"""
+
+import resource
+from dataclasses import dataclass, field
+
+from .discovery import MEDIA_DIR
+
+PROFILE_DIR = MEDIA_DIR / "profiles"
+PHASES = ("update", "rasterize", "encode")
+
+
+@dataclass
+class PlayProfile:
+    index: int
+    stack: tuple        # ("function:line", ...) from construct down to the call
+    animations: tuple   # animation class names
+    mobjects: int = 0
+    points: int = 0
+    frames: int = 0
+    seconds: dict = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    peak_rss_mb: float = 0.0
+
+    @property
+    def total(self):
+        return sum(self.seconds.values())
+
+    @property
+    def site(self):
+        return self.stack[-1] if self.stack else "?"
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux (bytes on macOS; close enough for a table)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def describe_animations(names):
+    counts = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    return ", ".join(f"{name}x{count}" if count > 1 else name for name, count in counts.items())
+
+
+def format_table(profiles, scene_name):
+    total = sum(profile.total for profile in profiles) or 1.0
+    lines = [
+        f"{scene_name}: {len(profiles)} play/wait calls, {total:.2f}s",
+        f"{'#':>4} {'call site':44} {'total':>7} {'%':>5} {'update':>7} {'raster':>7} {'encode':>7}"
+        f" {'frames':>6} {'mobs':>6} {'points':>8} {'rss MB':>7}  animations",
+    ]
+    for profile in sorted(profiles, key=lambda profile: profile.total, reverse=True):
+        s = profile.seconds
+        lines.append(
+            f"{profile.index:>4} {profile.site[-44:]:44} {profile.total:7.3f} {100 * profile.total / total:5.1f}"
+            f" {s['update']:7.3f} {s['rasterize']:7.3f} {s['encode']:7.3f}"
+            f" {profile.frames:>6} {profile.mobjects:>6} {profile.points:>8} {profile.peak_rss_mb:7.0f}"
+            f"  {describe_animations(profile.animations)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def format_folded(profiles, scene_name):
+    """Collapsed stacks, one line per (call, phase), weighted in microseconds."""
+    lines = []
+    for profile in profiles:
+        for phase in PHASES:
+            micros = round(profile.seconds[phase] * 1e6)
+            if micros:
+                lines.append(";".join((scene_name, *profile.stack, phase)) + f" {micros}")
+    return "\n".join(lines) + "\n"
+
+
+def write_reports(profiles, scene_name, stem, directory=PROFILE_DIR):
+    """Write ``<stem>.txt`` (sorted table) and ``<stem>.folded``; returns both paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    table = directory / f"{stem}.txt"
+    folded = directory / f"{stem}.folded"
+    table.write_text(format_table(profiles, scene_name), encoding="utf-8")
+    folded.write_text(format_folded(profiles, scene_name), encoding="utf-8")
+    return table, folded
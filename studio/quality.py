@@ -0,0 +1,72 @@
+"""Render quality profiles: draft, review and final.
+
+Bundles set their own resolution and frame rate at import time, sized for
+the published video. A profile is applied after the bundle is imported and
+scales those settings down, so iterating on a scene needs no edits to it:
+
+* ``draft`` renders at a quarter of the resolution and at most 15 fps,
+  keeps a third of the decorative glow layers (``glow_layers``), and draws
+  TeX that is not already in the shared cache as placeholder blocks
+  instead of running LaTeX. That is 16x fewer pixels for a 30 fps bundle
+  and 64x for a 60 fps one.
+* ``review`` renders at half resolution, at most 30 fps, with everything else
+  as in the final video.
+* ``final`` leaves the bundle's settings alone and is the default.
+
+The profile name travels to workers in ``STUDIO_QUALITY``, like the seed.
+"""
+
+import math
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QualityProfile:
+    name: str
+    scale: float                 # fraction of the bundle's pixel size
+    max_frame_rate: int = None   # cap on the bundle's frame rate
+    glow: float = 1.0            # fraction of glow layers kept
+    tex_placeholders: bool = False
+
+
+PROFILES = {
+    "draft": QualityProfile("draft", scale=0.25, max_frame_rate=15, glow=1 / 3, tex_placeholders=True),
+    "review": QualityProfile("review", scale=0.5, max_frame_rate=30),
+    "final": QualityProfile("final", scale=1.0),
+}
+DEFAULT_PROFILE = "final"
+
+
+def current_profile():
+    """The profile named by ``STUDIO_QUALITY`` (``final`` when unset)."""
+    name = os.environ.get("STUDIO_QUALITY") or DEFAULT_PROFILE
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown quality profile {name!r}; expected one of {', '.join(PROFILES)}") from None
+
+
+def _even(value):
+    # H.264 wants even frame dimensions
+    return max(2, 2 * round(value / 2))
+
+
+def apply_quality(config, profile=None):
+    """Scale the resolution and frame rate a bundle set on import to ``profile``."""
+    profile = profile or current_profile()
+    if profile.scale != 1:
+        config.pixel_width = _even(config.pixel_width * profile.scale)
+        config.pixel_height = _even(config.pixel_height * profile.scale)
+    if profile.max_frame_rate:
+        config.frame_rate = min(config.frame_rate, profile.max_frame_rate)
+    if profile.tex_placeholders:
+        from .tex_cache import use_tex_placeholders
+
+        use_tex_placeholders()
+    return profile
+
+
+def glow_layers(count):
+    """How many of ``count`` stacked glow layers to draw in the current profile."""
+    return max(1, math.ceil(count * current_profile().glow))
@@ -0,0 +1,155 @@
+"""Render bundle scenes in parallel, one fresh worker process per scene.
+
+Each bundle edits manim's global ``config`` at import time (resolution,
+frame size, background), so two scenes must never share an interpreter.
+Workers come from a ``spawn`` process pool that retires each one after a
+single task. They are not daemonic, so a render may start its own encoder
+process (``studio.encoder``).
+"""
+
+import dataclasses
+import importlib.util
+import os
+import shutil
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+from . import rng
+from .discovery import MEDIA_DIR
+from .framing import extra_framings, framing_output_path
+from .profiler import write_reports
+from .quality import DEFAULT_PROFILE, apply_quality
+from .tex_cache import use_tex_cache
+
+
+def load_module(module_path):
+    """Import a bundle by path, the same way ``manim render`` does."""
+    module_path = Path(module_path)
+    module_name = module_path.stem
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    sys.path.insert(0, str(module_path.parent.absolute()))
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_bundle(job):
+    """Import the job's bundle, then scale its ``config`` edits to the quality profile."""
+    from manim import config
+
+    module = load_module(job.module_path)
+    apply_quality(config)
+    return module
+
+
+def quality_job(job, quality):
+    """``job`` as rendered at ``quality``: anything but final goes to ``media/drafts/``."""
+    if quality == DEFAULT_PROFILE:
+        return job
+    return dataclasses.replace(job, output_path=MEDIA_DIR / "drafts" / f"{job.output_path.stem}.{quality}.mp4")
+
+
+def configure_worker(job, media_dir=MEDIA_DIR):
+    """Point manim's config at the shared media dir before the bundle loads."""
+    from manim import config
+
+    config.quality = "high_quality"
+    config.media_dir = str(media_dir)
+    config.input_file = str(job.module_path)
+    config.output_file = job.output_path.stem
+    config.progress_bar = "none"
+    config.verbosity = "WARNING"
+    rng.seed_globals()
+    use_tex_cache()
+
+
+def requested_formats():
+    """Formats named in ``STUDIO_FORMATS`` (comma separated), if any."""
+    return [name for name in os.environ.get("STUDIO_FORMATS", "").split(",") if name]
+
+
+def render_job(job, media_dir=MEDIA_DIR, progress=None):
+    """Render one scene in this process and copy the MP4 into its slot.
+
+    Formats requested in ``STUDIO_FORMATS`` besides the bundle's own are
+    filmed in the same pass and copied to ``<slot>_<format>.mp4``.
+    ``progress(frames)`` is called with the running frame count of a
+    single-framing, unprofiled render.
+    """
+    from manim import config
+
+    from .renderers import MultiFramingRenderer, ProfilingRenderer, ProgressRenderer, StudioRenderer
+
+    configure_worker(job, media_dir)
+    module = load_bundle(job)
+    profiling = bool(os.environ.get("STUDIO_PROFILE"))
+    # Profiles time a single framing
+    framings = [] if profiling else extra_framings(module, config, requested_formats())
+    if profiling:
+        renderer = ProfilingRenderer()
+    elif framings:
+        renderer = MultiFramingRenderer(framings)
+    elif progress is not None:
+        renderer = ProgressRenderer(progress)
+    else:
+        renderer = StudioRenderer()
+    scene = getattr(module, job.scene_name)(renderer=renderer)
+    scene.render()
+    if profiling:
+        write_reports(renderer.profiles, job.scene_name, job.output_path.stem)
+    movies = {job.output_path: scene.renderer.file_writer.movie_file_path}
+    if framings:
+        for name, movie_path in scene.renderer.movie_paths.items():
+            movies[framing_output_path(job.output_path, name)] = movie_path
+    job.output_path.parent.mkdir(parents=True, exist_ok=True)
+    for output_path, movie_path in movies.items():
+        shutil.copyfile(movie_path, output_path)
+    return job.output_path
+
+
+def _run(job):
+    start = time.perf_counter()
+    try:
+        render_job(job)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return {"job": job, "seconds": time.perf_counter() - start, "error": error}
+
+
+def run_in_pool(func, items, processes=None, ordered=False):
+    """Map ``func`` over ``items`` in fresh spawned workers, one item each.
+
+    Results are yielded as they finish unless ``ordered`` is set. The pool
+    defaults to one worker per core.
+    """
+    items = list(items)
+    if not items:
+        return
+    processes = min(processes or os.cpu_count() or 1, len(items))
+    # Not ``multiprocessing.Pool``: its workers are daemonic and may not
+    # start the encoder process a render needs
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=get_context("spawn"), max_tasks_per_child=1,
+    ) as pool:
+        if ordered:
+            yield from pool.map(func, items)
+        else:
+            for future in as_completed([pool.submit(func, item) for item in items]):
+                yield future.result()
+
+
+def render_all(jobs, processes=None):
+    """Render ``jobs`` across a process pool, yielding results as they finish.
+
+    Jobs are submitted largest source file first so the long scenes start
+    immediately and the wall time tracks the slowest scene rather than the
+    sum of all of them.
+    """
+    jobs = sorted(jobs, key=lambda job: job.module_path.stat().st_size, reverse=True)
+    yield from run_in_pool(_run, jobs, processes)
@@ -0,0 +1,473 @@
+"""Renderer variants used inside studio worker processes.
+
+Importing this module imports manim, so only workers should do it.
+"""
+
+import hashlib
+import itertools as it
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+from manim import __version__, config
+from manim.camera.camera import Camera
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.exceptions import EndSceneEarlyException
+from manim.utils.file_ops import is_png_format, is_webm_format, write_to_movie
+
+from .encoder import EncoderProcess
+from .profiler import PlayProfile, peak_rss_mb
+from .sprites import SpriteCamera
+
+
+class PipelinedFileWriter(SceneFileWriter):
+    """Scene file writer that encodes in a separate process (``encoder``).
+
+    Each ``play`` is still one partial movie with its own ffmpeg, but the
+    render no longer waits for a partial movie to finish before drawing the
+    next ``play``. ``finish`` waits for all of them before manim
+    concatenates the partial movies.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.encoder = None
+        super().__init__(*args, **kwargs)
+
+    def movie_command(self, file_path):
+        """manim's ffmpeg command for one partial movie from the Cairo renderer."""
+        fps = config.frame_rate
+        if fps == int(fps):
+            fps = int(fps)
+        command = [
+            config.ffmpeg_executable, "-y",
+            "-f", "rawvideo", "-s", f"{config.pixel_width}x{config.pixel_height}",
+            "-pix_fmt", "rgba", "-r", str(fps), "-i", "-", "-an",
+            "-loglevel", config.ffmpeg_loglevel.lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+        ]
+        if is_webm_format():
+            command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        elif config.transparent:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        return command + [str(file_path)]
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        if self.encoder is None:
+            self.encoder = EncoderProcess(config.pixel_width * config.pixel_height * 4)
+        self.encoder.open(self.movie_command(file_path), file_path)
+
+    def write_frame(self, frame_or_renderer):
+        self.write_frames(frame_or_renderer, 1)
+
+    def write_frames(self, frame, count, held=False):
+        """Write ``frame`` ``count`` times; it is copied before this returns.
+
+        ``held`` frames are unchanged since the previous one and reach the
+        encoder as a repeat count only, unless nothing has been written to
+        this partial movie yet.
+        """
+        if write_to_movie():
+            if held and self.encoder.has_frame:
+                self.encoder.repeat(count)
+            else:
+                self.encoder.write(frame, count)
+        if is_png_format() and not config.dry_run:
+            for _ in range(count):
+                self.output_image_from_array(frame)
+
+    def close_movie_pipe(self):
+        self.encoder.close_segment()
+
+    def finish(self):
+        if self.encoder is not None:
+            try:
+                self.encoder.drain()
+            finally:
+                self.encoder.shutdown()
+                self.encoder = None
+        super().finish()
+
+
+# Per-mobject state that decides how it is drawn
+DRAWN_ARRAYS = (
+    "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas", "pixel_array", "sheen_direction",
+)
+DRAWN_VALUES = ("stroke_width", "background_stroke_width", "sheen_factor", "z_index")
+
+
+def drawn_points(points):
+    """``points`` without trailing zero-length segments, which draw nothing.
+
+    A ``TracedPath`` whose point is at rest still appends one per frame.
+    """
+    if len(points) < 2 or not np.array_equal(points[-1], points[-2]):
+        return points
+    at_end = (points == points[-1]).all(axis=1)
+    run = np.argmin(at_end[::-1]) if not at_end.all() else len(points)
+    return points[:len(points) - run + 1]
+
+
+def frame_digest(camera, mobjects):
+    """Hash of the camera settings and mobject state a frame of ``mobjects`` is drawn from."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((
+        camera.pixel_width, camera.pixel_height, camera.frame_width, camera.frame_height,
+        tuple(camera.frame_center), str(camera.background_color), camera.background_opacity,
+    )).encode())
+    for mobject in it.chain.from_iterable(mobject.get_family() for mobject in mobjects):
+        points = drawn_points(mobject.points)
+        digest.update(repr((id(mobject), points.shape)).encode())
+        digest.update(np.ascontiguousarray(points).data)
+        for name in DRAWN_ARRAYS:
+            value = getattr(mobject, name, None)
+            if isinstance(value, np.ndarray):
+                digest.update(repr(value.shape).encode())
+                digest.update(np.ascontiguousarray(value).data)
+        digest.update(repr([getattr(mobject, name, None) for name in DRAWN_VALUES]).encode())
+    return digest.digest()
+
+
+class StudioRenderer(CairoRenderer):
+    """Cairo renderer with the studio camera and file writer.
+
+    The camera draws frozen groups from cached rasters (``sprites``) and
+    the writer encodes in a separate process (``PipelinedFileWriter``).
+    Frames go to the writer straight from the camera's pixel array, skipping
+    ``get_frame``'s copy.
+
+    Stock manim only freezes a ``wait`` when no mobject has an updater;
+    otherwise it redraws every frame even if the updaters change nothing.
+    Here each frame's moving mobjects are hashed first (``frame_digest``),
+    and a frame whose digest matches the one on screen is not redrawn: it
+    is sent as a repeat of the previous frame.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("camera_class", SpriteCamera)
+        kwargs.setdefault("file_writer_class", PipelinedFileWriter)
+        super().__init__(**kwargs)
+        self.camera_class = kwargs["camera_class"]
+
+    def update_frame(self, scene, *args, **kwargs):
+        # Whatever is drawn now no longer matches the recorded digest
+        self.camera.frame_digest = None
+        super().update_frame(scene, *args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.camera.frame_digest = None
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return
+        digest = frame_digest(self.camera, moving_mobjects)
+        if digest == getattr(self.camera, "frame_digest", None):
+            self.add_frame(self.camera.pixel_array, held=True)
+            return
+        self.update_frame(scene, moving_mobjects)
+        self.camera.frame_digest = digest
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, num_frames=int(duration / dt))
+
+    def add_frame(self, frame, num_frames=1, held=False):
+        """Write ``frame``; ``held`` marks it as unchanged since the last frame written."""
+        if self.skip_animations:
+            return
+        self.time += num_frames / self.camera.frame_rate
+        self.file_writer.write_frames(frame, num_frames, held=held)
+
+
+class ProgressRenderer(StudioRenderer):
+    """Cairo renderer that reports its running count of written frames to ``progress``."""
+
+    def __init__(self, progress, **kwargs):
+        super().__init__(**kwargs)
+        self.progress = progress
+        self.frames = 0
+
+    def add_frame(self, frame, num_frames=1, held=False):
+        super().add_frame(frame, num_frames, held)
+        if not self.skip_animations:
+            self.frames += num_frames
+            self.progress(self.frames)
+
+
+class FastForwardRenderer(StudioRenderer):
+    """Cairo renderer that does no rasterizing while animations are skipped.
+
+    Stock manim still captures one frame per skipped ``play`` (plus the
+    static background), which is wasted work when a worker only needs the
+    scene state at the start of the animations it actually renders.
+
+    ``stop_at`` ends the scene before that play index. Unlike
+    ``config.upto_animation_number`` it also works for index 0.
+    """
+
+    def __init__(self, stop_at=None, **kwargs):
+        super().__init__(**kwargs)
+        self.stop_at = stop_at
+
+    def update_skipping_status(self):
+        super().update_skipping_status()
+        if self.stop_at is not None and self.num_plays >= self.stop_at:
+            raise EndSceneEarlyException()
+
+    def update_frame(self, scene, *args, **kwargs):
+        if self.skip_animations:
+            return
+        super().update_frame(scene, *args, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return
+        super().render(scene, time, moving_mobjects)
+
+
+def scene_stack(scene):
+    """``function:line`` frames from the scene's source file, outermost first."""
+    source = type(scene).construct.__code__.co_filename
+    stack = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename == source:
+            stack.append(f"{getattr(code, 'co_qualname', code.co_name)}:{frame.f_lineno}")
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+class ProfilingRenderer(StudioRenderer):
+    """Cairo renderer that records a ``PlayProfile`` for every play/wait call.
+
+    Rasterize time is ``update_frame``, encode time is ``add_frame``
+    (copying the frame into the encoder's ring, or waiting for a free slot
+    when the encoder is behind), and update time is the rest of the call:
+    compiling and interpolating animations and running updaters.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.profiles = []
+        self.current = None
+
+    def play(self, scene, *args, **kwargs):
+        profile = PlayProfile(index=self.num_plays, stack=scene_stack(scene), animations=())
+        self.current = profile
+        start = time.perf_counter()
+        try:
+            super().play(scene, *args, **kwargs)
+        finally:
+            self.current = None
+            seconds = profile.seconds
+            elapsed = time.perf_counter() - start
+            seconds["update"] = max(elapsed - seconds["rasterize"] - seconds["encode"], 0.0)
+            profile.animations = tuple(type(animation).__name__ for animation in scene.animations or ())
+            family = scene.get_mobject_family_members()
+            profile.mobjects = len(family)
+            profile.points = sum(len(mobject.points) for mobject in family)
+            profile.peak_rss_mb = peak_rss_mb()
+            self.profiles.append(profile)
+
+    def _timed(self, phase, method, *args, **kwargs):
+        if self.current is None:
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self.current.seconds[phase] += time.perf_counter() - start
+
+    def update_frame(self, scene, *args, **kwargs):
+        return self._timed("rasterize", super().update_frame, scene, *args, **kwargs)
+
+    def get_frame(self):
+        return self._timed("rasterize", super().get_frame)
+
+    def add_frame(self, frame, num_frames=1, held=False):
+        if self.current is not None and not self.skip_animations:
+            self.current.frames += num_frames
+        return self._timed("encode", super().add_frame, frame, num_frames, held)
+
+
+@contextmanager
+def config_override(**values):
+    """Temporarily set ``config`` entries, restoring the old values afterwards."""
+    saved = {name: config[name] for name in values}
+    for name, value in values.items():
+        config[name] = value
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            config[name] = value
+
+
+class FramingFileWriter(PipelinedFileWriter):
+    """Scene file writer for one framing.
+
+    The primary writer (the renderer's own ``file_writer``) forwards every
+    per-play call except ``write_frame`` to its ``followers``, so the extra
+    framings get the same partial movies, sections and sound, while each
+    framing writes its own frames.
+    """
+
+    def __init__(self, renderer, scene_name, framing=None, **kwargs):
+        self.framing = framing
+        self.followers = []
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def open_movie_pipe(self, file_path=None):
+        if self.framing is None:
+            return super().open_movie_pipe(file_path)
+        # ffmpeg's input size comes from config
+        with config_override(pixel_width=self.framing.pixel_width, pixel_height=self.framing.pixel_height):
+            return super().open_movie_pipe(file_path)
+
+    def next_section(self, *args, **kwargs):
+        super().next_section(*args, **kwargs)
+        for follower in self.followers:
+            follower.next_section(*args, **kwargs)
+
+    def add_partial_movie_file(self, hash_animation):
+        super().add_partial_movie_file(hash_animation)
+        for follower in self.followers:
+            follower.add_partial_movie_file(hash_animation)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        super().begin_animation(allow_write, file_path)
+        for follower in self.followers:
+            follower.begin_animation(allow_write)
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        for follower in self.followers:
+            follower.end_animation(allow_write)
+
+    def add_audio_segment(self, *args, **kwargs):
+        super().add_audio_segment(*args, **kwargs)
+        for follower in self.followers:
+            follower.add_audio_segment(*args, **kwargs)
+
+    def finish(self):
+        super().finish()
+        for follower in self.followers:
+            follower.finish()
+
+
+class FramingView:
+    """Camera, file writer and static background of one extra framing."""
+
+    def __init__(self, framing, camera_class=Camera):
+        self.framing = framing
+        self.camera = camera_class(**framing.camera_kwargs())
+        self.file_writer = None
+        self.static_image = None
+        self.background = (self.camera.background_color, self.camera.background_opacity)
+
+    def follow(self, camera):
+        """Copy the primary camera's background if a scene restyled it."""
+        color, opacity = camera.background_color, camera.background_opacity
+        # Identity check: colours may be strings or ManimColors, and this runs every frame
+        if color is not self.background[0] or opacity != self.background[1]:
+            self.camera.background_color = color
+            self.camera.background_opacity = opacity
+            self.background = (color, opacity)
+
+
+class MultiFramingRenderer(StudioRenderer):
+    """Cairo renderer that also films the scene through extra framings.
+
+    Animations are compiled, interpolated and updated once per frame; every
+    framing then rasterizes the same mobjects through its own camera and
+    encodes its own movie. Movies of extra framings land next to the
+    primary one as ``<output>_<framing>.mp4``. Partial-movie caching is
+    disabled, since a cache hit for the primary framing says nothing about
+    the others.
+    """
+
+    def __init__(self, framings, **kwargs):
+        kwargs.setdefault("file_writer_class", FramingFileWriter)
+        super().__init__(**kwargs)
+        self.views = [FramingView(framing, self.camera_class) for framing in framings]
+        self.scene = None
+
+    def init_scene(self, scene):
+        config.disable_caching = True
+        super().init_scene(scene)
+        self.scene = scene
+        scene_name = type(scene).__name__
+        output_file = config.output_file or scene_name
+        for view in self.views:
+            name = view.framing.name
+            with config_override(output_file=f"{output_file}_{name}"):
+                view.file_writer = FramingFileWriter(self, f"{scene_name}_{name}", framing=view.framing)
+        self.file_writer.followers = [view.file_writer for view in self.views]
+
+    @contextmanager
+    def as_view(self, view):
+        """Swap ``view``'s camera, writer and background in for the primary ones."""
+        primary = self.camera, self.file_writer, self.static_image, self.time
+        # Scenes restyle the primary camera in construct()
+        view.follow(self.camera)
+        self.camera, self.file_writer, self.static_image = view.camera, view.file_writer, view.static_image
+        try:
+            yield view
+        finally:
+            view.static_image = self.static_image
+            # Only the primary framing advances the scene clock
+            self.camera, self.file_writer, self.static_image, self.time = primary
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        for view in self.views:
+            with self.as_view(view):
+                super().save_static_frame_data(scene, static_mobjects)
+        return super().save_static_frame_data(scene, static_mobjects)
+
+    def render(self, scene, time, moving_mobjects):
+        super().render(scene, time, moving_mobjects)
+        for view in self.views:
+            with self.as_view(view):
+                super().render(scene, time, moving_mobjects)
+
+    def freeze_current_frame(self, duration):
+        super().freeze_current_frame(duration)
+        for view in self.views:
+            with self.as_view(view):
+                self.update_frame(self.scene, mobjects=self.scene.moving_mobjects)
+                super().freeze_current_frame(duration)
+
+    @property
+    def movie_paths(self):
+        """Framing name -> movie file of every extra framing."""
+        return {view.framing.name: view.file_writer.movie_file_path for view in self.views}
+
+
+class FrameServerRenderer(StudioRenderer):
+    """Cairo renderer that hands each frame to ``sink`` instead of ffmpeg.
+
+    ``sink(pixels, count)`` gets the camera's own RGBA pixel array, not a
+    copy, and the number of consecutive frames it stands for (a ``wait``
+    is one frame repeated). The next frame is drawn into the same array, so
+    the sink must be done with it before returning. Run with
+    ``config.dry_run`` so the file writer never starts ffmpeg.
+    """
+
+    def __init__(self, sink, **kwargs):
+        super().__init__(**kwargs)
+        self.sink = sink
+
+    def add_frame(self, frame, num_frames=1, held=False):
+        if self.skip_animations:
+            return
+        self.time += num_frames / self.camera.frame_rate
+        self.sink(frame, num_frames)
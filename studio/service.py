@@ -0,0 +1,393 @@
+"""Local render service: one queue for every tool that wants a scene rendered.
+
+``python3 -m studio service`` listens on a UNIX socket (``SOCKET_PATH``)
+for newline-delimited JSON. A client sends one request::
+
+    {"op": "submit", "targets": ["05"], "quality": "draft", "seed": 0}
+
+and reads events until ``{"event": "end"}``: ``queued``, ``cached``,
+``started``, ``progress`` (``frames`` and ``total``), ``done`` and
+``failed``, each carrying the job ``id`` and ``scene``.
+``python3 -m studio submit`` is such a client.
+
+Each job renders in a fresh spawned worker process through ``render_job``,
+exactly as ``python3 -m studio render`` would, so the bundles in ``code/``
+need no changes. A request identical to one already queued or running
+(same render-cache key: scene, sources, quality and seed) joins that job
+instead of rendering twice. An output that is fresh in ``render_cache.json``
+is answered as ``cached``.
+
+Jobs start first come, first served while the running jobs' estimated
+memory stays within the budget (``--memory-mb``, default three quarters of
+physical memory). A job whose scene and quality rendered before is
+estimated at that render's peak RSS, otherwise at ``DEFAULT_JOB_MB``. The
+job table is SQLite (``DB_PATH``). It also supplies the ``total`` of
+progress events: the frame count of the scene's last render at that
+quality (``None`` the first time).
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+
+from . import rng
+from .cache import RenderCache, cache_key
+from .discovery import REPO_ROOT, SceneJob, discover_jobs
+from .profiler import peak_rss_mb
+from .quality import DEFAULT_PROFILE, PROFILES
+from .render import quality_job, render_job
+
+SOCKET_PATH = REPO_ROOT / ".cache" / "studio.sock"
+DB_PATH = REPO_ROOT / ".cache" / "render_jobs.sqlite"
+# Memory estimate for a scene that has not rendered at this quality before
+DEFAULT_JOB_MB = {"draft": 512, "review": 1024, "final": 2048}
+# Seconds between progress events from one worker
+PROGRESS_INTERVAL = 0.25
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    scene TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    output TEXT NOT NULL,
+    state TEXT NOT NULL,
+    frames INTEGER,
+    peak_rss_mb REAL,
+    error TEXT,
+    submitted REAL NOT NULL,
+    started REAL,
+    finished REAL
+)
+"""
+
+
+def default_memory_budget():
+    """Three quarters of physical memory, in MiB."""
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return 8192
+    return total * 0.75 / 2**20
+
+
+class JobTable:
+    """Every job the service has seen, in SQLite."""
+
+    def __init__(self, path=DB_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        with self.db:
+            self.db.execute(SCHEMA)
+
+    def abandon_unfinished(self):
+        """Close out jobs a previous service left queued or running."""
+        with self.db:
+            self.db.execute("UPDATE jobs SET state = 'abandoned' WHERE state IN ('queued', 'running')")
+
+    def add(self, job, key, quality, seed, state="queued"):
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO jobs (key, scene, quality, seed, output, state, submitted) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, job.label, quality, seed, str(job.output_path), state, time.time()),
+            )
+        return cursor.lastrowid
+
+    def update(self, job_id, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self.db:
+            self.db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def last_done(self, job, quality):
+        """The most recent finished render of ``job`` at ``quality``, if any."""
+        return self.db.execute(
+            "SELECT * FROM jobs WHERE scene = ? AND quality = ? AND state = 'done' ORDER BY finished DESC LIMIT 1",
+            (job.label, quality),
+        ).fetchone()
+
+    def recent(self, limit=20):
+        rows = self.db.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+
+def run_service_job(task):
+    """Worker: render one job, sending ``(job_id, frames)`` to ``progress`` as it goes."""
+    job_id, job, quality, seed, progress = task
+    # Plain single-framing render whatever the service was started with
+    os.environ["STUDIO_QUALITY"] = quality
+    os.environ.pop("STUDIO_PROFILE", None)
+    os.environ.pop("STUDIO_FORMATS", None)
+    rng.set_seed(seed)
+    state = {"frames": 0, "sent": 0.0}
+
+    def report(frames):
+        state["frames"] = frames
+        now = time.perf_counter()
+        if now - state["sent"] >= PROGRESS_INTERVAL:
+            state["sent"] = now
+            progress.put((job_id, frames))
+
+    start = time.perf_counter()
+    try:
+        render_job(job, progress=report)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return {
+        "seconds": time.perf_counter() - start, "frames": state["frames"],
+        "peak_rss_mb": peak_rss_mb(), "error": error,
+    }
+
+
+@dataclass
+class Entry:
+    """A job queued or running in this service, and the clients following it."""
+    id: int
+    job: SceneJob
+    key: str
+    quality: str
+    seed: int
+    memory_mb: float
+    total: int = None
+    listeners: list = field(default_factory=list)
+
+
+class RenderService:
+    """Deduplicating, memory-capped job queue in front of a worker process pool."""
+
+    def __init__(self, table, memory_mb, workers):
+        self.table = table
+        self.memory_mb = memory_mb
+        self.workers = workers
+        self.pending = deque()
+        self.running = {}
+        self.by_key = {}
+        self.context = get_context("spawn")
+        self.executor = self.new_executor()
+        self.manager = self.context.Manager()
+        self.progress = self.manager.Queue()
+
+    def new_executor(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context, max_tasks_per_child=1)
+
+    def event(self, entry, name, **fields):
+        return {"event": name, "id": entry.id, "scene": entry.job.label, **fields}
+
+    def emit(self, entry, name, **fields):
+        event = self.event(entry, name, **fields)
+        for listener in entry.listeners:
+            listener.put_nowait(event)
+
+    def submit(self, request, listener):
+        """Queue the request's jobs; returns the ids ``listener`` will hear finish."""
+        quality = request.get("quality") or DEFAULT_PROFILE
+        if quality not in PROFILES:
+            listener.put_nowait({"event": "error", "error": f"unknown quality profile {quality!r}"})
+            return set()
+        seed = request.get("seed")
+        seed = rng.get_seed() if seed is None else int(seed)
+        extra = {"seed": seed}
+        if quality != DEFAULT_PROFILE:
+            extra["quality"] = quality
+        jobs = discover_jobs(request.get("targets") or None)
+        if not jobs:
+            listener.put_nowait({"event": "error", "error": "no scenes matched"})
+        cache = RenderCache()
+        waiting = set()
+        for job in jobs:
+            job = quality_job(job, quality)
+            key = cache_key(job, extra)
+            entry = self.by_key.get(key)
+            if entry is not None:
+                entry.listeners.append(listener)
+                state = "started" if entry.id in self.running else "queued"
+                listener.put_nowait(self.event(entry, state, deduplicated=True))
+                waiting.add(entry.id)
+                continue
+            if not request.get("force") and cache.is_fresh(job, key):
+                job_id = self.table.add(job, key, quality, seed, state="cached")
+                listener.put_nowait({"event": "cached", "id": job_id, "scene": job.label, "output": str(job.output_path)})
+                continue
+            previous = self.table.last_done(job, quality)
+            entry = Entry(
+                id=self.table.add(job, key, quality, seed),
+                job=job, key=key, quality=quality, seed=seed,
+                memory_mb=previous["peak_rss_mb"] if previous else DEFAULT_JOB_MB[quality],
+                total=previous["frames"] if previous else None,
+                listeners=[listener],
+            )
+            self.pending.append(entry)
+            self.by_key[key] = entry
+            listener.put_nowait(self.event(entry, "queued", memory_mb=round(entry.memory_mb)))
+            waiting.add(entry.id)
+        self.pump()
+        return waiting
+
+    def pump(self):
+        """Start queued jobs, in order, while they fit the worker and memory budgets."""
+        while self.pending and len(self.running) < self.workers:
+            entry = self.pending[0]
+            in_use = sum(running.memory_mb for running in self.running.values())
+            # One job always runs, however large its estimate
+            if self.running and in_use + entry.memory_mb > self.memory_mb:
+                break
+            self.pending.popleft()
+            self.start(entry)
+
+    def start(self, entry):
+        self.running[entry.id] = entry
+        self.table.update(entry.id, state="running", started=time.time())
+        self.emit(entry, "started", total=entry.total)
+        try:
+            future = self.run_in_worker(entry)
+        except Exception:
+            self.forget(entry)
+            self.fail(entry, traceback.format_exc())
+            return
+        future.add_done_callback(lambda future: self.finish(entry, future))
+
+    def run_in_worker(self, entry):
+        loop = asyncio.get_running_loop()
+        task = (entry.id, entry.job, entry.quality, entry.seed, self.progress)
+        try:
+            return loop.run_in_executor(self.executor, run_service_job, task)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory) and took the pool with it
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = self.new_executor()
+            return loop.run_in_executor(self.executor, run_service_job, task)
+
+    def forget(self, entry):
+        """Drop a job that is no longer running, so identical requests start afresh."""
+        del self.running[entry.id]
+        del self.by_key[entry.key]
+
+    def fail(self, entry, error):
+        self.table.update(entry.id, state="failed", error=error, finished=time.time())
+        self.emit(entry, "failed", error=error)
+
+    def finish(self, entry, future):
+        self.forget(entry)
+        try:
+            result = future.result()
+        except Exception:
+            # The worker process died (e.g. killed for memory)
+            result = {"seconds": 0.0, "frames": 0, "peak_rss_mb": None, "error": traceback.format_exc()}
+        if result["error"]:
+            self.fail(entry, result["error"])
+        else:
+            self.table.update(
+                entry.id, state="done", frames=result["frames"],
+                peak_rss_mb=result["peak_rss_mb"], finished=time.time(),
+            )
+            # Reload: CLI renders may have written the index meanwhile
+            cache = RenderCache()
+            cache.record(entry.job, entry.key)
+            cache.save()
+            self.emit(
+                entry, "done", output=str(entry.job.output_path),
+                frames=result["frames"], seconds=round(result["seconds"], 1),
+            )
+        self.pump()
+
+    async def relay_progress(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self.progress.get)
+            if item is None:
+                return
+            job_id, frames = item
+            entry = self.running.get(job_id)
+            if entry is not None:
+                self.emit(entry, "progress", frames=frames, total=entry.total)
+
+    async def handle(self, reader, writer):
+        """One client connection: a single request, answered with events."""
+        listener = asyncio.Queue()
+        waiting = set()
+        try:
+            request = json.loads(await reader.readline() or b"{}")
+            if request.get("op") == "submit":
+                waiting = self.submit(request, listener)
+            else:
+                listener.put_nowait({"event": "error", "error": f"unknown op {request.get('op')!r}"})
+            while waiting or not listener.empty():
+                event = await listener.get()
+                if event["event"] in ("done", "failed"):
+                    waiting.discard(event["id"])
+                writer.write(json.dumps(event).encode("utf-8") + b"\n")
+                await writer.drain()
+            writer.write(b'{"event": "end"}\n')
+            await writer.drain()
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            # A client that hangs up leaves its jobs running for the others
+            for entry in [*self.pending, *self.running.values()]:
+                if listener in entry.listeners:
+                    entry.listeners.remove(listener)
+            writer.close()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.manager.shutdown()
+
+
+def socket_in_use(path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+async def run_service(socket_path=SOCKET_PATH, memory_mb=None, workers=None, on_ready=None):
+    """Serve render requests on ``socket_path`` until cancelled."""
+    if socket_in_use(socket_path):
+        raise RuntimeError(f"a render service is already listening on {socket_path}")
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+    table = JobTable()
+    table.abandon_unfinished()
+    service = RenderService(table, memory_mb or default_memory_budget(), workers or os.cpu_count() or 1)
+    server = await asyncio.start_unix_server(service.handle, path=str(socket_path))
+    relay = asyncio.create_task(service.relay_progress())
+    if on_ready:
+        on_ready(service)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.progress.put(None)
+        await relay
+        service.close()
+        socket_path.unlink(missing_ok=True)
+
+
+async def submit(request, socket_path=SOCKET_PATH):
+    """Send one request to the service and yield its events up to ``end``."""
+    reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    try:
+        writer.write(json.dumps({"op": "submit", **request}).encode("utf-8") + b"\n")
+        await writer.drain()
+        while line := await reader.readline():
+            event = json.loads(line)
+            if event["event"] == "end":
+                return
+            yield event
+    finally:
+        writer.close()
+        await writer.wait_closed()
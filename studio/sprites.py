@@ -0,0 +1,283 @@
+"""Draw static vector groups from a cached raster instead of re-tessellating them.
+
+``freeze(group)`` marks a group. ``SpriteCamera`` (used by every studio
+render worker) rasterizes a marked group once, at its own output
+resolution and aligned to its pixel grid, and afterwards paints that
+raster with a single Cairo blit wherever the group is drawn. A still group
+therefore comes out pixel-identical to drawing its paths, and a group
+that only moves rigidly (``shift``, ``rotate``, ``MoveAlongPath``) is
+blitted with the same motion. Sub-pixel motion is resampled bilinearly,
+so the edges of a moving sprite are slightly softer than its paths.
+
+Any other change, such as new points, a scale (stroke widths would scale
+with the raster) or a colour or opacity change (``FadeIn``), falls back to
+drawing the vectors. The group is rasterized again once it has held still
+for two consecutive draws. So animations on frozen groups look as they
+always did, and the raster only pays off while the group is at rest.
+
+Manim hands the camera flattened families (a moving group followed by
+its members, or just the members for the static background), so the
+camera stands the sprite in for every member of a frozen group, but only
+when all of the group's members are being drawn in that pass.
+
+Plain ``manim`` renders use the stock camera and ignore the mark.
+"""
+
+import itertools as it
+import math
+import weakref
+
+import cairo
+import numpy as np
+from manim import BLACK, Camera, VMobject
+
+# Raster sizes beyond this many frames' worth of pixels are not worth caching
+MAX_RASTER_FRAMES = 4
+# Antialiasing margin around the group, in pixels
+PAD_PIXELS = 2
+
+# Every group marked by ``freeze``, so its members can be traced back to it
+_FROZEN = weakref.WeakSet()
+
+
+def freeze(group):
+    """Mark ``group`` to be drawn from a cached raster while it is static."""
+    group.sprite_frozen = True
+    _FROZEN.add(group)
+    return group
+
+
+def thaw(group):
+    group.sprite_frozen = False
+    _FROZEN.discard(group)
+    return group
+
+
+def frozen_owners():
+    """``id(member) -> group`` for every family member of a frozen group.
+
+    A member of nested frozen groups belongs to the outermost one.
+    """
+    owners = {}
+    families = [(group, group.get_family()) for group in list(_FROZEN)]
+    for group, family in sorted(families, key=lambda item: len(item[1]), reverse=True):
+        for member in family:
+            owners.setdefault(id(member), group)
+    return owners
+
+
+def rigid_motion(before, after, tolerance):
+    """``(R, t)`` with ``after ~ before @ R.T + t`` in the xy plane, or ``None``."""
+    if before.shape != after.shape:
+        return None
+    if np.array_equal(before, after):
+        return np.eye(2), np.zeros(2)
+    if np.abs(after[:, 2] - before[:, 2]).max() > tolerance:
+        return None
+    b, a = before[:, :2], after[:, :2]
+    b_center, a_center = b.mean(axis=0), a.mean(axis=0)
+    db, da = b - b_center, a - a_center
+    angle = math.atan2(np.sum(db[:, 0] * da[:, 1] - db[:, 1] * da[:, 0]), np.sum(db * da))
+    cos, sin = math.cos(angle), math.sin(angle)
+    rotation = np.array([[cos, -sin], [sin, cos]])
+    if np.abs(db @ rotation.T - da).max() > tolerance:
+        return None
+    return rotation, a_center - rotation @ b_center
+
+
+class Sprite:
+    """One frozen group's raster on one camera, and where to draw it this frame."""
+
+    def __init__(self, group):
+        self.group = group
+        self.z_index = group.z_index
+        self.points = None          # family points when rasterized
+        self.style = None
+        self.camera_state = None
+        self.surface = None
+        self.pixels = None          # keeps the surface's buffer alive
+        self.origin = None          # scene coords of raster pixel (0, 0)
+        self.pending = None         # state seen last draw, while not rasterized
+        self.motion = None
+
+    def state(self, family):
+        points = np.concatenate([mobject.points for mobject in family])
+        style = np.concatenate([
+            np.concatenate([
+                mobject.fill_rgbas.ravel(), mobject.stroke_rgbas.ravel(),
+                mobject.background_stroke_rgbas.ravel(),
+                [mobject.stroke_width, mobject.background_stroke_width, mobject.sheen_factor],
+                np.asarray(mobject.sheen_direction, dtype=float).ravel(),
+            ])
+            for mobject in family
+        ])
+        return points, style
+
+
+class SpriteCamera(Camera):
+    """Cairo camera that blits frozen groups (see ``freeze``) from cached rasters."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sprites = {}
+
+    def type_or_raise(self, mobject):
+        if isinstance(mobject, Sprite):
+            return Sprite
+        return super().type_or_raise(mobject)
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        for group_type, group in it.groupby(mobjects, self.type_or_raise):
+            if group_type is Sprite:
+                for sprite in group:
+                    self.display_sprite(sprite, self.pixel_array)
+            else:
+                self.display_funcs[group_type](list(group), self.pixel_array)
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        if not include_submobjects:
+            return super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+        mobjects = list(mobjects)
+        drawn = {id(member) for mobject in mobjects for member in mobject.get_family()}
+        owners = frozen_owners()
+        sprites = {}
+        collected = []
+        for mobject in mobjects:
+            self.collect(mobject, collected, owners, sprites, drawn)
+        # Like extract_mobject_family_members: keep the last of any duplicates
+        seen = set()
+        members = []
+        for mobject in reversed(collected):
+            if id(mobject) not in seen:
+                seen.add(id(mobject))
+                members.append(mobject)
+        members.reverse()
+        if self.use_z_index:
+            members.sort(key=lambda mobject: mobject.z_index)
+        if excluded_mobjects:
+            excluded = set(map(id, it.chain.from_iterable(m.get_family() for m in excluded_mobjects)))
+            members = [mobject for mobject in members if id(mobject) not in excluded]
+        return members
+
+    def collect(self, mobject, members, owners, sprites, drawn):
+        """Family members with points, in draw order, with ready sprites standing in.
+
+        ``owners`` maps members to their frozen group (``frozen_owners``),
+        ``sprites`` caches each group's sprite for this pass and ``drawn``
+        holds the ids of everything drawn in it.
+        """
+        group = owners.get(id(mobject))
+        if group is not None:
+            if id(group) not in sprites:
+                # Half a group drawn from its raster would paint the other half twice
+                whole = all(id(member) in drawn for member in group.family_members_with_points())
+                sprites[id(group)] = self.sprite_for(group) if whole else None
+            sprite = sprites[id(group)]
+            if sprite is not None:
+                # Each member stands in as the sprite; duplicates are dropped later
+                members.append(sprite)
+                return
+        if len(mobject.points):
+            members.append(mobject)
+        for submobject in mobject.submobjects:
+            self.collect(submobject, members, owners, sprites, drawn)
+
+    def sprite_for(self, group):
+        """The group's sprite placed for this frame, or ``None`` to draw vectors."""
+        family = group.family_members_with_points()
+        if not family or any(
+            not isinstance(mobject, VMobject) or mobject.z_index != group.z_index for mobject in family
+        ):
+            return None
+        sprite = self.sprites.get(id(group))
+        if sprite is None or sprite.group is not group:
+            sprite = self.sprites[id(group)] = Sprite(group)
+        points, style = sprite.state(family)
+        camera_state = (self.pixel_width, self.pixel_height, self.frame_width, self.frame_height,
+                        tuple(self.frame_center))
+
+        if sprite.surface is not None and sprite.camera_state == camera_state and np.array_equal(style, sprite.style):
+            units_per_pixel = self.frame_width / self.pixel_width
+            sprite.motion = rigid_motion(sprite.points, points, 0.01 * units_per_pixel)
+            if sprite.motion is not None:
+                return sprite
+
+        # Changed (or new): rasterize once it has held still for two draws
+        pending = sprite.pending
+        if (
+            pending is None or pending[2] != camera_state
+            or not np.array_equal(pending[0], points) or not np.array_equal(pending[1], style)
+        ):
+            sprite.pending = (points, style, camera_state)
+            return None
+        sprite.pending = None
+        if not self.rasterize(sprite, family, points, style, camera_state):
+            return None
+        return sprite
+
+    def rasterize(self, sprite, family, points, style, camera_state):
+        """Render the group alone onto a transparent, pixel-aligned raster."""
+        group = sprite.group
+        units_per_pixel_x = self.frame_width / self.pixel_width
+        units_per_pixel_y = self.frame_height / self.pixel_height
+        stroke = max(max(mobject.stroke_width, mobject.background_stroke_width) for mobject in family)
+        # Cairo line width is stroke_width * 0.01 scene units; allow for miter joins
+        pad = stroke * self.cairo_line_width_multiple / min(units_per_pixel_x, units_per_pixel_y) + PAD_PIXELS
+
+        def pixel_x(x):
+            return (x - self.frame_center[0]) / units_per_pixel_x + self.pixel_width / 2
+
+        def pixel_y(y):
+            return -(y - self.frame_center[1]) / units_per_pixel_y + self.pixel_height / 2
+
+        low, high = points.min(axis=0), points.max(axis=0)
+        left, right = math.floor(pixel_x(low[0]) - pad), math.ceil(pixel_x(high[0]) + pad)
+        top, bottom = math.floor(pixel_y(high[1]) - pad), math.ceil(pixel_y(low[1]) + pad)
+        width, height = right - left, bottom - top
+        if width * height > MAX_RASTER_FRAMES * self.pixel_width * self.pixel_height:
+            return False
+
+        origin = np.array([
+            (left - self.pixel_width / 2) * units_per_pixel_x + self.frame_center[0],
+            -(top - self.pixel_height / 2) * units_per_pixel_y + self.frame_center[1],
+        ])
+        raster_camera = Camera(
+            pixel_width=width, pixel_height=height,
+            frame_width=width * units_per_pixel_x, frame_height=height * units_per_pixel_y,
+            frame_center=np.array([
+                origin[0] + width * units_per_pixel_x / 2,
+                origin[1] - height * units_per_pixel_y / 2,
+                0.0,
+            ]),
+            # All-zero background: Cairo's premultiplied "transparent"
+            background_color=BLACK, background_opacity=0,
+            use_z_index=self.use_z_index,
+            cairo_line_width_multiple=self.cairo_line_width_multiple,
+        )
+        raster_camera.capture_mobjects([group])
+        # The pixel array is already in Cairo's premultiplied ARGB32 layout
+        sprite.pixels = np.ascontiguousarray(raster_camera.pixel_array)
+        sprite.surface = cairo.ImageSurface.create_for_data(sprite.pixels, cairo.FORMAT_ARGB32, width, height)
+        sprite.origin = origin
+        sprite.points, sprite.style, sprite.camera_state = points, style, camera_state
+        sprite.z_index = group.z_index
+        sprite.motion = (np.eye(2), np.zeros(2))
+        return True
+
+    def display_sprite(self, sprite, pixel_array):
+        rotation, translation = sprite.motion
+        scale_x = self.frame_width / self.pixel_width
+        scale_y = self.frame_height / self.pixel_height
+        x0, y0 = rotation @ sprite.origin + translation
+        ctx = self.get_cairo_context(pixel_array)
+        ctx.save()
+        # Raster pixel (u, v) -> scene point, on top of the camera's scene -> pixel matrix
+        ctx.transform(cairo.Matrix(
+            rotation[0, 0] * scale_x, rotation[1, 0] * scale_x,
+            -rotation[0, 1] * scale_y, -rotation[1, 1] * scale_y,
+            x0, y0,
+        ))
+        ctx.set_source_surface(sprite.surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
@@ -0,0 +1,277 @@
+"""Persistent, content-addressed TeX -> SVG cache shared by every scene and run.
+
+manim names each compiled expression after a hash of the full LaTeX document
+and reuses the SVG if it already sits in ``config.tex_dir``. That directory
+normally lives inside ``media/``, so scratch media dirs (chunk workers, fresh
+checkouts) recompile everything. We point ``tex_dir`` at ``TEX_CACHE_DIR``
+instead (``manim.cfg`` does the same for plain ``manim`` runs), keep it under
+a size budget with least-recently-used eviction, and warm it ahead of a
+render from the TeX literals found in ``code/*.py``.
+
+Warming compiles each missing expression in a private temp dir and moves the
+SVG in atomically, so it is safe to run alongside renders.
+"""
+
+import ast
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .discovery import REPO_ROOT
+
+TEX_CACHE_DIR = Path(os.environ.get("STUDIO_TEX_CACHE", REPO_ROOT / ".cache" / "tex"))
+MAX_CACHE_BYTES = int(os.environ.get("STUDIO_TEX_CACHE_MB", 256)) * 2**20
+
+# class name -> (default environment, default arg_separator)
+TEX_CLASSES = {
+    "SingleStringMathTex": ("align*", None),
+    "MathTex": ("align*", " "),
+    "Tex": ("center", ""),
+}
+
+KEPT_SUFFIXES = {".svg", ".tex"}
+
+# Draft renders draw uncompiled TeX as blocks; see use_tex_placeholders
+PLACEHOLDER_DIR = TEX_CACHE_DIR / "placeholders"
+# Rough size of one glyph in dvisvgm's units (pt at 10pt), so placeholders
+# come out about as large as the real formula
+GLYPH_WIDTH, GLYPH_HEIGHT = 5.5, 7.0
+
+
+def use_tex_cache():
+    """Send this process's TeX compilation through the shared cache."""
+    from manim import config
+
+    TEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    config.tex_dir = str(TEX_CACHE_DIR)
+    # Parallel workers share the dir; manim's cleanup would delete the
+    # .aux/.dvi files of another worker's compile. evict() sweeps them.
+    config.no_latex_cleanup = True
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError):
+        return None
+
+
+def _dict_values_by_key(tree):
+    """Map each string dict key in the module to the string values it holds."""
+    values = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Dict):
+            for key, value in zip(node.keys, node.values):
+                key, value = _literal(key) if key else None, _literal(value)
+                if isinstance(key, str) and isinstance(value, str):
+                    values.setdefault(key, []).append(value)
+    return values
+
+
+def find_tex_calls(path):
+    """Yield ``(class_name, tex_strings, kwargs)`` for each TeX literal in a bundle.
+
+    Arguments must be string literals, except for a single ``row["key"]``
+    lookup, which expands to every string stored under ``"key"`` in the
+    module (the stage tables in ``02_Poles_and_Zeros.py``). Calls with a
+    custom ``tex_template`` or ``**kwargs`` are skipped.
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    by_key = _dict_values_by_key(tree)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+            continue
+        if node.func.id not in TEX_CLASSES:
+            continue
+        kwargs = {}
+        for keyword in node.keywords:
+            if keyword.arg is None or keyword.arg == "tex_template":
+                break
+            if keyword.arg in ("tex_environment", "arg_separator", "substrings_to_isolate", "tex_to_color_map"):
+                kwargs[keyword.arg] = _literal(keyword.value)
+        else:
+            if len(node.args) == 1 and isinstance(node.args[0], ast.Subscript):
+                key = _literal(node.args[0].slice)
+                for value in by_key.get(key, []) if isinstance(key, str) else []:
+                    yield node.func.id, (value,), kwargs
+                continue
+            strings = tuple(_literal(arg) for arg in node.args)
+            if strings and all(isinstance(s, str) for s in strings):
+                yield node.func.id, strings, kwargs
+
+
+def tex_expressions(class_name, tex_strings, kwargs):
+    """The ``(expression, environment)`` pairs manim compiles for one mobject.
+
+    Mirrors ``MathTex``: the joined string is compiled once, then every
+    ``{{ }}``/isolated piece is compiled again as its own SVG.
+    """
+    from manim import MathTex, SingleStringMathTex
+
+    environment, separator = TEX_CLASSES[class_name]
+    environment = kwargs.get("tex_environment") or environment
+    single = SingleStringMathTex.__new__(SingleStringMathTex)
+    if separator is None:
+        return [(single._get_modified_expression(tex_strings[0]), environment)]
+
+    splitter = MathTex.__new__(MathTex)
+    splitter.substrings_to_isolate = kwargs.get("substrings_to_isolate") or []
+    splitter.tex_to_color_map = kwargs.get("tex_to_color_map") or {}
+    pieces = splitter._break_up_tex_strings(tex_strings)
+    separator = kwargs.get("arg_separator", separator)
+    return [
+        (single._get_modified_expression(tex), environment)
+        for tex in [separator.join(pieces), *pieces]
+    ]
+
+
+def cached_svg_path(expression, environment, tex_template=None):
+    """Where manim will look for the SVG of ``expression``."""
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash
+
+    tex_template = tex_template or config.tex_template
+    code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return TEX_CACHE_DIR / f"{tex_hash(code)}.svg"
+
+
+def placeholder_svg(expression):
+    """SVG of one rounded block about as wide as ``expression`` typesets."""
+    # A control word is roughly one glyph; braces, scripts and spaces are none
+    visible = re.sub(r"\\[a-zA-Z]+", "x", expression)
+    visible = re.sub(r"[{}^_$&\\\s]", "", visible)
+    width = GLYPH_WIDTH * max(len(visible), 1)
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{width}pt" height="{GLYPH_HEIGHT}pt" viewBox="0 0 {width} {GLYPH_HEIGHT}">'
+        f'<rect x="0" y="0" width="{width}" height="{GLYPH_HEIGHT}" rx="1.5"/></svg>\n'
+    )
+
+
+def placeholder_svg_file(expression, environment=None, tex_template=None):
+    """Stand-in for manim's ``tex_to_svg_file`` that never runs LaTeX.
+
+    Returns the real SVG when the shared cache already has it, otherwise a
+    placeholder block (written once per expression).
+    """
+    svg_path = cached_svg_path(expression, environment, tex_template)
+    if svg_path.exists():
+        return svg_path
+    path = PLACEHOLDER_DIR / svg_path.name
+    if not path.exists():
+        PLACEHOLDER_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(placeholder_svg(expression), encoding="utf-8")
+    return path
+
+
+def use_tex_placeholders():
+    """Make this process's ``Tex``/``MathTex`` use ``placeholder_svg_file``."""
+    from manim.mobject.text import tex_mobject
+
+    tex_mobject.tex_to_svg_file = placeholder_svg_file
+
+
+def compile_to_cache(expression, environment):
+    """Make sure ``expression`` has an SVG in the cache; returns ``"hit"`` or ``"compiled"``."""
+    from manim import config
+    from manim.utils.tex_file_writing import convert_to_svg, tex_compilation_command
+
+    svg_path = cached_svg_path(expression, environment)
+    if svg_path.exists():
+        os.utime(svg_path)
+        return "hit"
+
+    template = config.tex_template
+    TEX_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="warm-", dir=TEX_CACHE_DIR) as scratch:
+        scratch = Path(scratch)
+        tex_file = scratch / svg_path.with_suffix(".tex").name
+        tex_file.write_text(
+            template.get_texcode_for_expression_in_env(expression, environment),
+            encoding="utf-8",
+        )
+        command = tex_compilation_command(template.tex_compiler, template.output_format, tex_file, scratch)
+        subprocess.run(command, shell=True, cwd=scratch)
+        dvi_file = tex_file.with_suffix(template.output_format)
+        if not dvi_file.exists():
+            raise ValueError(f"{template.tex_compiler} failed on {expression!r}")
+        svg_file = convert_to_svg(dvi_file, template.output_format)
+        os.replace(svg_file, svg_path)
+        os.replace(tex_file, svg_path.with_suffix(".tex"))
+    return "compiled"
+
+
+def _warm_one(item):
+    try:
+        return item, compile_to_cache(*item), None
+    except Exception as error:
+        return item, "failed", error
+
+
+def warm(paths, workers=None):
+    """Compile every TeX literal in ``paths`` into the cache, in parallel.
+
+    ``latex`` and ``dvisvgm`` run as subprocesses, so a thread pool keeps
+    every core busy without importing manim once per worker. Returns a
+    count per outcome plus the list of failures.
+    """
+    items = []
+    for path in paths:
+        for call in find_tex_calls(path):
+            items.extend(tex_expressions(*call))
+    items = list(dict.fromkeys(items))
+
+    counts = {"hit": 0, "compiled": 0, "failed": 0}
+    failures = []
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for item, outcome, error in pool.map(_warm_one, items):
+            counts[outcome] += 1
+            if error is not None:
+                failures.append((item, error))
+    return counts, failures
+
+
+def evict(max_bytes=MAX_CACHE_BYTES, grace_seconds=3600):
+    """Trim the cache to ``max_bytes``, dropping least recently used entries first.
+
+    Compiler leftovers (``.aux``, ``.log``, ``.dvi``) and abandoned warm
+    dirs older than ``grace_seconds`` are removed first; they may belong
+    to a compile that is still running. An entry's recency is the newest
+    mtime among its files, refreshed whenever warming hits or compiles it.
+    Returns the number of bytes freed.
+    """
+    if not TEX_CACHE_DIR.exists():
+        return 0
+    cutoff = time.time() - grace_seconds
+    freed = 0
+    entries = {}
+    for path in TEX_CACHE_DIR.iterdir():
+        stat = path.stat()
+        if path.is_dir():
+            if path.name.startswith("warm-") and stat.st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+            continue
+        if path.suffix not in KEPT_SUFFIXES:
+            if stat.st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                freed += stat.st_size
+            continue
+        entry = entries.setdefault(path.stem, {"files": [], "size": 0, "used": 0})
+        entry["files"].append(path)
+        entry["size"] += stat.st_size
+        entry["used"] = max(entry["used"], stat.st_mtime)
+
+    total = sum(entry["size"] for entry in entries.values())
+    for entry in sorted(entries.values(), key=lambda entry: entry["used"]):
+        if total <= max_bytes:
+            break
+        for path in entry["files"]:
+            path.unlink(missing_ok=True)
+        total -= entry["size"]
+        freed += entry["size"]
+    return freed
@@ -0,0 +1,76 @@
+"""Process-wide cache of parsed ``Text`` glyph outlines.
+
+Every ``Text(...)`` runs Pango (or checks its SVG on disk), parses the SVG
+and closes each glyph's curves in a Python loop, even when the same label
+was built a moment ago. Scenes that rebuild labels every step ("Step 3",
+progress-bar sections, calculation boxes) pay that each time.
+
+``cached_text`` builds each distinct (string, font, size, weight, ...)
+once in white and hands out deep copies recoloured to the requested
+colour, so colour never splits the cache. Entries are evicted least
+recently used beyond ``maxsize``.
+"""
+
+from collections import OrderedDict
+
+# Options applied after parsing on a per-character basis; a recolour
+# would wipe them, so texts using them are built directly
+_UNCACHEABLE = {"t2c", "text2color", "t2g", "text2gradient", "gradient"}
+
+
+class TextCache:
+    """Bounded LRU of ``Text`` prototypes with hit/miss counters."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._prototypes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, color=None, **kwargs):
+        """A fresh ``Text`` equal to ``Text(text, color=color, **kwargs)``."""
+        from manim import WHITE, Text
+
+        if _UNCACHEABLE.intersection(kwargs):
+            self.misses += 1
+            return Text(text, color=color, **kwargs)
+        try:
+            key = (text, tuple(sorted(kwargs.items())))
+            prototype = self._prototypes.get(key)
+        except TypeError:
+            # Unhashable option (e.g. a t2f dict); nothing to share
+            self.misses += 1
+            return Text(text, color=color, **kwargs)
+
+        if prototype is None:
+            self.misses += 1
+            prototype = Text(text, color=WHITE, **kwargs)
+            self._prototypes[key] = prototype
+            if len(self._prototypes) > self.maxsize:
+                self._prototypes.popitem(last=False)
+        else:
+            self.hits += 1
+            self._prototypes.move_to_end(key)
+
+        label = prototype.copy()
+        if color is not None:
+            label.set_color(color)
+        return label
+
+    def info(self):
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "size": len(self._prototypes), "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        self._prototypes.clear()
+        self.hits = self.misses = 0
+
+
+TEXT_CACHE = TextCache()
+
+
+def cached_text(text, color=None, **kwargs):
+    """Drop-in for ``Text`` that reuses glyphs parsed earlier in this process."""
+    return TEXT_CACHE.get(text, color=color, **kwargs)
@@ -0,0 +1,116 @@
+"""Stream ``(step, loss)`` pairs from training logs and downsample on the fly.
+
+Logs can have millions of rows, so nothing here holds a whole log in
+memory: rows are read lazily, folded into a bounded set of min/max buckets,
+and the survivors are thinned to the final point count with LTTB
+(Largest-Triangle-Three-Buckets).
+"""
+
+import csv
+import json
+import math
+from pathlib import Path
+
+JSONL_SUFFIXES = {".jsonl", ".ndjson", ".json"}
+
+
+def read_training_log(path, step_key="step", loss_key="loss"):
+    """Yield ``(step, loss)`` from a CSV or JSON Lines log, one row at a time.
+
+    Rows without a finite loss (eval lines, NaN spikes) are skipped. When
+    there is no step column the row index is used instead.
+    """
+    path = Path(path)
+    with path.open(newline="", encoding="utf-8") as fp:
+        if path.suffix.lower() in JSONL_SUFFIXES:
+            rows = (json.loads(line) for line in fp if line.strip())
+        else:
+            rows = csv.DictReader(fp)
+        for index, row in enumerate(rows):
+            try:
+                loss = float(row[loss_key])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not math.isfinite(loss):
+                continue
+            step = row.get(step_key)
+            yield (float(step) if step not in (None, "") else float(index)), loss
+
+
+def minmax_buckets(points, max_buckets):
+    """Fold a point stream into at most ``max_buckets`` min/max buckets.
+
+    Buckets start one point wide; whenever ``max_buckets`` fill up,
+    neighbours merge pairwise and the width doubles, so memory stays
+    bounded for any stream length. Returns the min and max point of every
+    bucket in step order, plus the first and last points of the stream.
+    """
+    buckets = []
+    width = 1
+    current = None
+    filled = 0
+    first = last = None
+    for point in points:
+        if first is None:
+            first = point
+        last = point
+        if current is None:
+            current = [point, point]
+        else:
+            if point[1] < current[0][1]:
+                current[0] = point
+            if point[1] > current[1][1]:
+                current[1] = point
+        filled += 1
+        if filled < width:
+            continue
+        buckets.append(current)
+        current, filled = None, 0
+        if len(buckets) == max_buckets:
+            buckets = [
+                [min(a[0], b[0], key=lambda p: p[1]), max(a[1], b[1], key=lambda p: p[1])]
+                for a, b in zip(buckets[::2], buckets[1::2])
+            ] + ([buckets[-1]] if len(buckets) % 2 else [])
+            width *= 2
+    if current is not None:
+        buckets.append(current)
+    if first is None:
+        return []
+
+    kept = {first, last}
+    for low, high in buckets:
+        kept.add(low)
+        kept.add(high)
+    return sorted(kept)
+
+
+def lttb(points, target):
+    """Largest-Triangle-Three-Buckets downsampling of an in-memory list."""
+    n = len(points)
+    if target >= n:
+        return list(points)
+    if target < 3:
+        return [points[0], points[-1]][:target]
+    every = (n - 2) / (target - 2)
+    sampled = [points[0]]
+    a = 0
+    for i in range(target - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        window = points[avg_start:avg_end]
+        avg_x = sum(p[0] for p in window) / len(window)
+        avg_y = sum(p[1] for p in window) / len(window)
+        ax, ay = points[a]
+        best = max(
+            range(int(i * every) + 1, int((i + 1) * every) + 1),
+            key=lambda j: abs((ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay)),
+        )
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
+
+
+def downsample_log(points, target):
+    """Reduce a ``(step, loss)`` stream to ``target`` points that keep its shape."""
+    return lttb(minmax_buckets(points, max_buckets=2 * target), target)
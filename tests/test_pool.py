@@ -0,0 +1,38 @@
+"""MobjectPool hands each instance to one owner at a time."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from studio.pool import MobjectPool  # noqa: E402
+
+
+class Particle:
+    """Just enough of a mobject for the pool's snapshot and reset."""
+
+    def __init__(self):
+        self.points = np.zeros((4, 3))
+        self.z_index = 0
+
+    def get_family(self):
+        return [self]
+
+
+def test_double_release_is_rejected():
+    pool = MobjectPool(Particle)
+    first, second = pool.acquire(2)
+    pool.release(first)
+    with pytest.raises(ValueError):
+        pool.release(first)
+    with pytest.raises(ValueError):
+        pool.release(second, second)
+    assert pool.info() == {"created": 2, "free": 1, "in_use": 1, "high_water": 2}
+
+    pool.release(second)
+    again = pool.acquire(2)
+    assert again[0] is not again[1]
+    assert pool.info()["in_use"] == 2
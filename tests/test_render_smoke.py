@@ -0,0 +1,72 @@
+"""Render a trivial bundle end to end through the studio's worker pool."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from studio.discovery import discover_jobs  # noqa: E402
+from studio.render import render_all, run_in_pool  # noqa: E402
+
+SMOKE_BUNDLE = '''\
+from manim import *
+
+config.pixel_width = 640
+config.pixel_height = 360
+config.frame_rate = 15
+
+
+class Smoke(Scene):
+    def construct(self):
+        square = Square(color=BLUE)
+        self.play(Create(square), run_time=0.5)
+        self.wait(0.5)
+'''
+
+
+def start_encoder(_):
+    from studio.encoder import EncoderProcess
+
+    encoder = EncoderProcess(64)
+    try:
+        encoder.drain()
+    finally:
+        encoder.shutdown()
+    return "ok"
+
+
+def test_pool_workers_may_start_an_encoder():
+    assert list(run_in_pool(start_encoder, [1, 2], processes=2)) == ["ok", "ok"]
+
+
+@pytest.fixture
+def smoke_jobs(tmp_path, monkeypatch):
+    pytest.importorskip("manim")
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg is not installed")
+    code_dir = tmp_path / "code"
+    code_dir.mkdir()
+    (code_dir / "01_Smoke.py").write_text(SMOKE_BUNDLE)
+    monkeypatch.setenv("STUDIO_QUALITY", "draft")
+    return discover_jobs(code_dir=code_dir, videos_dir=tmp_path / "videos")
+
+
+def test_render_all_writes_the_movie(smoke_jobs):
+    (job,) = smoke_jobs
+    (result,) = render_all(smoke_jobs, processes=1)
+    assert result["error"] is None, result["error"]
+    assert job.output_path.stat().st_size > 0
+
+
+def test_render_all_writes_every_framing(smoke_jobs, monkeypatch):
+    from studio.framing import framing_output_path
+
+    (job,) = smoke_jobs
+    monkeypatch.setenv("STUDIO_FORMATS", "landscape,portrait")
+    (result,) = render_all(smoke_jobs, processes=1)
+    assert result["error"] is None, result["error"]
+    assert job.output_path.stat().st_size > 0
+    assert framing_output_path(job.output_path, "portrait").stat().st_size > 0
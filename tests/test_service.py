@@ -0,0 +1,65 @@
+"""The render service keeps serving after a worker process dies."""
+
+import asyncio
+import os
+import signal
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from studio import service as service_module  # noqa: E402
+from studio.discovery import discover_jobs  # noqa: E402
+from studio.service import JobTable, RenderService  # noqa: E402
+
+FAILING_BUNDLE = '''\
+raise RuntimeError("bundle failed to load")
+'''
+
+
+def kill_worker():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+async def next_outcome(listener):
+    while True:
+        event = await asyncio.wait_for(listener.get(), timeout=120)
+        if event["event"] in ("done", "failed"):
+            return event
+
+
+def test_submit_after_a_worker_dies(tmp_path, monkeypatch):
+    code_dir = tmp_path / "code"
+    code_dir.mkdir()
+    (code_dir / "01_Failing.py").write_text(FAILING_BUNDLE + "\n\nclass Failing(Scene):\n    pass\n")
+    jobs = discover_jobs(code_dir=code_dir, videos_dir=tmp_path / "videos")
+    monkeypatch.setattr(service_module, "discover_jobs", lambda targets: jobs)
+
+    async def scenario():
+        service = RenderService(JobTable(tmp_path / "jobs.sqlite"), memory_mb=4096, workers=1)
+        try:
+            with pytest.raises(BrokenProcessPool):
+                await asyncio.get_running_loop().run_in_executor(service.executor, kill_worker)
+
+            listener = asyncio.Queue()
+            (job_id,) = service.submit({"targets": ["01"], "quality": "draft", "force": True}, listener)
+            event = await next_outcome(listener)
+            assert event["id"] == job_id
+            # The job reached a fresh worker, which reported the bundle's own error
+            assert event["event"] == "failed"
+            assert "BrokenProcessPool" not in event["error"]
+            assert not service.running and not service.by_key
+            assert service.table.recent()[-1]["state"] == "failed"
+
+            # An identical request starts a new job instead of joining a dead one
+            again = asyncio.Queue()
+            (second_id,) = service.submit({"targets": ["01"], "quality": "draft", "force": True}, again)
+            assert second_id != job_id
+            assert (await next_outcome(again))["id"] == second_id
+        finally:
+            service.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+"""Frozen groups drawn from their raster match their vectors."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+manim = pytest.importorskip("manim")
+sprites = pytest.importorskip("studio.sprites")
+from manim.utils.family import extract_mobject_family_members  # noqa: E402
+
+CAMERA = {"pixel_width": 320, "pixel_height": 180, "frame_width": 16.0, "frame_height": 9.0}
+
+
+def glowing_group():
+    # Translucent layers show up as brighter pixels if painted twice
+    rect = manim.Rectangle(width=4, height=2, color=manim.BLUE, fill_opacity=0.3)
+    window = manim.Square(side_length=1, color=manim.YELLOW, fill_opacity=0.3)
+    glow = manim.Circle(radius=1.5, color=manim.WHITE, stroke_width=12, stroke_opacity=0.3)
+    return manim.VGroup(rect, window, glow)
+
+
+def draw(camera, mobjects):
+    camera.reset()
+    camera.capture_mobjects(mobjects)
+    return camera.pixel_array.copy()
+
+
+def test_flattened_family_is_drawn_once_from_the_sprite():
+    group = sprites.freeze(glowing_group())
+    flattened = extract_mobject_family_members([group])
+    camera = sprites.SpriteCamera(**CAMERA)
+    # The raster is made once the group has held still for two draws
+    for _ in range(3):
+        frame = draw(camera, flattened)
+    displayed = camera.get_mobjects_to_display(flattened)
+    assert [type(mobject) for mobject in displayed] == [sprites.Sprite]
+
+    expected = draw(manim.Camera(**CAMERA), [glowing_group()])
+    assert np.abs(frame.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_static_members_without_the_group_use_the_sprite():
+    group = sprites.freeze(glowing_group())
+    # The static background pass only passes members with points
+    members = group.family_members_with_points()
+    camera = sprites.SpriteCamera(**CAMERA)
+    for _ in range(3):
+        draw(camera, members)
+    assert [type(mobject) for mobject in camera.get_mobjects_to_display(members)] == [sprites.Sprite]
+    # Part of a group is drawn as vectors, never as the whole raster
+    assert camera.get_mobjects_to_display(members[:1]) == members[:1]